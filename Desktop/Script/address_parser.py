@@ -0,0 +1,109 @@
+import re
+from functools import lru_cache
+from collections import namedtuple
+
+import pandas as pd
+
+from parsing import POSTAL_CODE, PROVINCE, ADDRESS_START, province_name
+
+# Listing addresses ("12 rue Principale, Wendake (Québec) G0A 4V0") split into
+# street, municipality, province and postal code.
+#
+# The province comes from the postal code's first letter when there is one -
+# Canada Post assigns those by province - and only falls back to a written
+# province ("(Québec)", "NB") when there isn't. The same addresses repeat all
+# over the OCR output, so each distinct string is parsed once.
+
+Address = namedtuple('Address', ['street', 'municipality', 'province', 'postal_code'])
+EMPTY = Address('', '', '', '')
+
+# First letter of the forward sortation area (first half of the postal code)
+FSA_PROVINCE = {
+    'A': 'Newfoundland and Labrador',
+    'B': 'Nova Scotia',
+    'C': 'Prince Edward Island',
+    'E': 'New Brunswick',
+    'G': 'Quebec', 'H': 'Quebec', 'J': 'Quebec',
+    'K': 'Ontario', 'L': 'Ontario', 'M': 'Ontario', 'N': 'Ontario', 'P': 'Ontario',
+    'R': 'Manitoba',
+    'S': 'Saskatchewan',
+    'T': 'Alberta',
+    'V': 'British Columbia',
+    'X': 'Northwest Territories',
+    'Y': 'Yukon',
+}
+# X is shared by the two territories - Nunavut has these FSAs
+FSA_OVERRIDES = {'X0A': 'Nunavut', 'X0B': 'Nunavut', 'X0C': 'Nunavut'}
+
+CACHE_SIZE = 100000
+
+# A province written at the end of the address, with or without brackets
+TRAILING_PROVINCE = re.compile(rf"[\s,(]*\(?(?:{PROVINCE.pattern})\)?[\s,.)]*$")
+
+
+def fsa_province(postal_code):
+    """Province for a postal code from its FSA - '' if it isn't a Canadian one"""
+    fsa = postal_code[:3].upper()
+    return FSA_OVERRIDES.get(fsa) or FSA_PROVINCE.get(fsa[:1], '')
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_address(text):
+    """Address(street, municipality, province, postal_code) for one address string"""
+    if not text:
+        return EMPTY
+    match = POSTAL_CODE.search(text)
+    postal = re.sub(r'\s+', '', match.group()) if match else ''
+    rest = POSTAL_CODE.sub('', text, count=1) if match else text
+    if postal:
+        postal = f"{postal[:3]} {postal[3:]}"
+
+    # Only a province at the end counts - "rue Ontario, Montréal" is in Quebec
+    written_province = ''
+    trailing = TRAILING_PROVINCE.search(rest)
+    if trailing:
+        written_province = province_name(PROVINCE.search(trailing.group()).group())
+        rest = rest[:trailing.start()]
+    province = (fsa_province(postal) if postal else '') or written_province
+
+    parts = [part.strip(' ,.()') for part in rest.split(',')]
+    parts = [part for part in parts if part]
+    if len(parts) > 1:
+        street, municipality = ', '.join(parts[:-1]), parts[-1]
+    elif parts and ADDRESS_START.match(parts[0]):
+        street, municipality = parts[0], ''
+    elif parts:
+        street, municipality = '', parts[0]
+    else:
+        street, municipality = '', ''
+    return Address(street, municipality, province, postal)
+
+
+_rows_seen = 0
+
+
+def parse_addresses(addresses):
+    """parse_address() for a whole Series - each distinct string is parsed once
+
+    Returns a DataFrame (street, municipality, province, postal_code) on the
+    same index; missing addresses come back as empty strings.
+    """
+    global _rows_seen
+    codes, uniques = pd.factorize(addresses)
+    parsed = [parse_address(str(value)) for value in uniques] + [EMPTY]
+    _rows_seen += len(codes)
+    # factorize gives missing values code -1, which lands on the EMPTY at the end
+    table = pd.DataFrame(parsed, columns=Address._fields, dtype=object)
+    return table.iloc[codes].set_index(addresses.index)
+
+
+def cache_stats():
+    """(addresses seen, addresses actually parsed) since the module was loaded"""
+    return _rows_seen, parse_address.cache_info().misses
+
+
+def print_cache_stats():
+    seen, parsed = cache_stats()
+    if seen:
+        print(f"🗺️  Address parser: {seen:,} addresses, {parsed:,} parsed "
+              f"({1 - parsed / seen:.0%} served from cache)")
@@ -1,6 +1,8 @@
 import pandas as pd
 from datetime import datetime
 
+from phone_index import NO_PHONE, PhoneIndex, normalize_phones, format_phone_number, phone_keys
+
 print("Indigenous Business Fraud Risk Analysis")
 print("="*50)
 
@@ -33,13 +35,22 @@ print(f"\n🚨 MISSING ADDRESSES (Red Flag):")
 print(f"  All businesses: {len(no_address_all)} ({len(no_address_all)/len(all_businesses)*100:.1f}%)")
 print(f"  High-value targets: {len(no_address_high)} ({len(no_address_high)/len(high_value)*100:.1f}%)")
 
-# Duplicate phone analysis
-phone_counts = all_businesses['Phone'].value_counts()
-duplicate_phones = phone_counts[phone_counts > 1]
+# Duplicate phone analysis - through one hash index on phone_keys: the int64 E.164
+# phone, or the written phone where it didn't normalize, so a garbled number that
+# repeats still counts
+if 'Phone E164' not in all_businesses.columns:
+    all_businesses['Phone E164'] = normalize_phones(all_businesses['Phone'])
+phones = all_businesses['Phone'].astype(object).where(all_businesses['Phone'].notna(), '').map(str).str.strip()
+e164 = all_businesses['Phone E164'].fillna(NO_PHONE).astype('int64')
+keys = phone_keys(e164, phones).where(phones != '', NO_PHONE)
+phone_index = PhoneIndex(keys, all_businesses.index)
+duplicate_phones = phone_index.duplicates()
 print(f"\n📞 DUPLICATE PHONE NUMBERS: {len(duplicate_phones)}")
 if len(duplicate_phones) > 0:
-    for phone, count in duplicate_phones.head(5).items():
-        businesses = all_businesses[all_businesses['Phone'] == phone]['Business Name'].tolist()
+    for key, count in duplicate_phones.head(5).items():
+        ids = phone_index.lookup(key)
+        businesses = all_businesses.loc[ids, 'Business Name'].tolist()
+        phone = format_phone_number(key) if key > 0 else phones[ids[0]]
         print(f"  {phone} used by {count} businesses:")
         for biz in businesses[:3]:
             print(f"    - {biz}")
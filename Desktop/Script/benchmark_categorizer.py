@@ -0,0 +1,105 @@
+import re
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from cleaning_engine import CATEGORY_RULES
+from keyword_categorizer import KeywordCategorizer
+
+# Names per second for one script's keyword categories: the old if/elif
+# any(word in name) chain (row-wise apply, as the scripts ran it, and mapped
+# over the names), one regex per rule (str.contains), and the token index -
+# name by name, and over the distinct names only. --distinct repeats a
+# smaller pool of names the way OCR output repeats the same businesses.
+#
+# The substring baselines get each pattern with its * ^ $ stripped, so they
+# are the old scripts' matching. "agree" is how many names get the same
+# category as the first run - token matching differs from substrings on
+# purpose, so the token index doesn't reach 100%.
+
+FILLER = ['Atikamekw', 'Wendake', 'Mohawk', 'Kahnawake', 'Innu', 'Cree', 'Mi\'gmaq', 'Nord', 'Inc.',
+          'Ltée', 'Enr.', 'Frères', 'Sept-Îles', 'Mashteuiatsh', 'Eeyou', 'General', '&', 'Les', 'du']
+
+
+def substring_rules(rules):
+    """The rules as plain lowercase substrings, the way the scripts matched them"""
+    def words(patterns):
+        return [pattern.strip('^$').replace('*', '').lower() for pattern in patterns]
+    return [(rule[0],) + tuple(words(patterns) for patterns in rule[1:]) for rule in rules]
+
+
+def chain(rules, default):
+    """The scripts' categorizer: if/elif any(word in name) ... in rule order"""
+    def category(name):
+        name = name.lower()
+        for rule in rules:
+            unless = rule[2] if len(rule) > 2 else []
+            if any(word in name for word in rule[1]) and not any(word in name for word in unless):
+                return rule[0]
+        return default
+    return category
+
+
+def regex_per_rule(names, rules, default):
+    """One str.contains pass per rule, then np.select"""
+    lower = names.str.lower()
+    hits = [lower.str.contains('|'.join(re.escape(word) for word in rule[1])).to_numpy(dtype=bool)
+            for rule in rules]
+    unless = [lower.str.contains('|'.join(re.escape(word) for word in rule[2])).to_numpy(dtype=bool)
+              if len(rule) > 2 else np.zeros(len(names), dtype=bool) for rule in rules]
+    return pd.Series(np.select([h & ~u for h, u in zip(hits, unless)], [rule[0] for rule in rules], default),
+                     index=names.index, dtype=object)
+
+
+def synthetic_names(n, rules, seed):
+    """Directory-style names - about a third carry a category keyword"""
+    rng = np.random.default_rng(seed)
+    keywords = sorted({word.title() for rule in substring_rules(rules) for words in rule[1:] for word in words})
+    vocab = np.asarray(FILLER * 2 + keywords, dtype=object)
+    parts = vocab[rng.integers(0, len(vocab), (n, 3))]
+    return pd.Series(parts[:, 0] + ' ' + parts[:, 1] + ' ' + parts[:, 2], dtype=object)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark keyword categorization on synthetic names")
+    parser.add_argument('--names', type=int, default=1000000)
+    parser.add_argument('--script', choices=sorted(CATEGORY_RULES), default='final_cleanup')
+    parser.add_argument('--distinct', type=int, help="draw the names from a pool of this many")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rules, default = CATEGORY_RULES[args.script]
+    names = synthetic_names(args.distinct or args.names, rules, args.seed)
+    if args.distinct:
+        names = names.sample(args.names, replace=True, random_state=args.seed, ignore_index=True)
+    frame = pd.DataFrame({'Business Name': names})
+
+    print("⏱️  CATEGORIZER BENCHMARK")
+    print("=" * 60)
+    print(f"📄 {len(names):,} names ({names.str.lower().nunique():,} distinct), {args.script} rules "
+          f"({len(rules)} categories, {sum(len(words) for rule in rules for words in rule[1:])} keywords)")
+
+    substrings = substring_rules(rules)
+    legacy = chain(substrings, default)
+    categorizer = KeywordCategorizer(rules, default)
+    runs = [
+        ('apply(axis=1) chain', lambda: frame.apply(lambda row: legacy(row['Business Name']), axis=1)),
+        ('if/elif chain', lambda: names.map(legacy)),
+        ('regex per rule', lambda: regex_per_rule(names, substrings, default)),
+        ('token index per name', lambda: names.map(categorizer.category)),
+        ('token index, distinct names', lambda: categorizer.categorize(names)),
+    ]
+
+    print(f"\n   {'method':<28}  {'seconds':>8}  {'names/s':>11}  {'agree':>7}")
+    expected = None
+    for label, run in runs:
+        start = time.perf_counter()
+        result = run()
+        seconds = time.perf_counter() - start
+        result = result.to_numpy()
+        if expected is None:
+            expected = result
+        agree = (result == expected).mean()
+        print(f"   {label:<28}  {seconds:>8.2f}  {len(names) / seconds:>11,.0f}  {agree:>7.1%}")
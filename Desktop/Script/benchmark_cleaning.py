@@ -0,0 +1,497 @@
+import re
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from cleaning_engine import clean
+
+# The old iterrows() loops from the cleaning scripts vs cleaning_engine.py, on a
+# large synthetic OCR dump. Every cleaner's output has to match the loop's exactly
+# (values, column order, row order) before its timing counts.
+
+
+# ---- the loops as they were in each script ---------------------------------
+
+def legacy_clean_data(df):
+    new_data = []
+    for _, row in df.iterrows():
+        full_text = row['name']
+        phone = row['phone']
+        address_match = re.search(r'(\d+[\s,]|rue|boul|avenue|route|chemin|CP|C\.P\.|av\.|blvd)', full_text, re.I)
+        if address_match:
+            business_name = full_text[:address_match.start()].strip(' ,.-_')
+            address = full_text[address_match.start():].strip()
+        else:
+            business_name = full_text.strip(' ,.-_')
+            address = ""
+        postal_match = re.search(r'[A-Z]\d[A-Z]\s*\d[A-Z]\d', address if address else full_text)
+        postal_code = postal_match.group(0) if postal_match else ""
+        new_data.append({
+            'business_name': business_name,
+            'address': address,
+            'postal_code': postal_code,
+            'phone': phone,
+            'original_text': full_text,
+            'source': row['folder']
+        })
+    clean_df = pd.DataFrame(new_data)
+    return clean_df[clean_df['business_name'].str.len() > 3]
+
+
+def legacy_deep_clean(df):
+    clean_businesses = []
+    for _, row in df.iterrows():
+        full_text = str(row['name']).strip()
+        phone = str(row['phone']).strip()
+        junk_patterns = [
+            r'^(phone|fax|tel|fox|tél|téléc|suite|tel\.|fax\.|fox\.)[\s:]*$',
+            r'^[A-Z]{2,}[\s]*$',
+            r'^\W+$',
+            r'^[\d\s\-\(\)]+$',
+            r'^\.+$',
+            r'^\s*$'
+        ]
+        if any(re.match(pattern, full_text, re.I) for pattern in junk_patterns):
+            continue
+        if len(full_text) < 5:
+            continue
+        if full_text.startswith('\\') or full_text.startswith("'") or full_text.endswith("_"):
+            full_text = full_text.strip("\\'_")
+        postal_match = re.search(r'[A-Z]\d[A-Z]\s*\d[A-Z]\d', full_text)
+        postal_code = postal_match.group(0) if postal_match else ""
+        address_patterns = r'(\d+[\s,]+(?:rue|boul|avenue|road|drive|street|chemin)|P\.?O\.?\s*Box|General Delivery|Suite\s+\d+)'
+        address_match = re.search(address_patterns, full_text, re.I)
+        if address_match:
+            business_name = full_text[:address_match.start()].strip(' ,.-_')
+            address = full_text[address_match.start():].strip()
+        else:
+            if ',' in full_text:
+                parts = full_text.split(',', 1)
+                business_name = parts[0].strip()
+                address = parts[1].strip() if len(parts) > 1 else ""
+            else:
+                business_name = full_text
+                address = ""
+        business_name = re.sub(r'[\s,\._-]+$', '', business_name).strip()
+        if len(business_name) < 3:
+            continue
+        if business_name.lower() in ['suite', 'phone', 'fax', 'tel', 'general', 'delivery']:
+            continue
+        if '__' in business_name or business_name.count('(') != business_name.count(')'):
+            continue
+        clean_businesses.append({
+            'business_name': business_name,
+            'address': address,
+            'postal_code': postal_code,
+            'phone': phone,
+            'source': row['folder']
+        })
+    clean_df = pd.DataFrame(clean_businesses)
+    clean_df = clean_df.drop_duplicates(subset=['business_name', 'phone'])
+    return clean_df.sort_values('business_name')
+
+
+def legacy_ultra_clean(df):
+    def extract_postal_code(address_text):
+        patterns = [
+            r'([A-Z]\d[A-Z]\s*\d[A-Z]\d)\s*$',
+            r'\)\s*([A-Z]\d[A-Z]\s*\d[A-Z]\d)',
+            r',\s*([A-Z]\d[A-Z]\s*\d[A-Z]\d)',
+        ]
+        for pattern in patterns:
+            match = re.search(pattern, str(address_text))
+            if match:
+                return match.group(1).replace(' ', '')
+        return ''
+
+    def clean_address(address, postal):
+        if not postal:
+            return address
+        clean = str(address).replace(postal, '')
+        clean = clean.replace(postal[:3] + ' ' + postal[3:], '')
+        clean = re.sub(r'[,\s\)]+$', '', clean)
+        clean = re.sub(r'\s+', ' ', clean)
+        clean = clean.replace(' ,', ',').replace(' )', ')')
+        return clean.strip()
+
+    cleaned_data = []
+    for _, row in df.iterrows():
+        address = str(row.get('Address', ''))
+        existing_postal = str(row.get('Postal Code', ''))
+        found_postal = extract_postal_code(address)
+        if found_postal:
+            final_postal = found_postal
+            clean_addr = clean_address(address, found_postal)
+        else:
+            final_postal = existing_postal if existing_postal != 'nan' else ''
+            clean_addr = address
+        cleaned_data.append({
+            'Business Name': row['Business Name'],
+            'Address': clean_addr,
+            'Postal Code': final_postal,
+            'Phone': row['Phone'],
+            'Province': row.get('Province', 'Unknown'),
+            'Category': row.get('Category', 'Other')
+        })
+    return pd.DataFrame(cleaned_data)
+
+
+def legacy_final_deep_clean(df):
+    clean_data = []
+    for _, row in df.iterrows():
+        business_name = row['business_name']
+        address = str(row['address']) if pd.notna(row['address']) else ''
+        phone = row['phone']
+        postal_pattern = r'([A-Z]\d[A-Z]\s*\d[A-Z]\d)'
+        postal_match = re.search(postal_pattern, address)
+        if postal_match:
+            postal_code = postal_match.group(1)
+            clean_address = address.replace(postal_code, '').strip()
+            clean_address = re.sub(r'[,.\s]+$', '', clean_address)
+        else:
+            postal_code = row['postal_code'] if pd.notna(row['postal_code']) else ''
+            clean_address = address
+        clean_address = re.sub(r'\s+', ' ', clean_address)
+        clean_address = clean_address.replace(' ,', ',')
+        if len(business_name) < 5 or business_name.startswith('.'):
+            continue
+        clean_data.append({
+            'Business Name': business_name,
+            'Address': clean_address,
+            'Postal Code': postal_code,
+            'Phone': phone,
+            'Province': 'Quebec' if 'québec' in address.lower() or 'quebec' in address.lower() else
+                       'New Brunswick' if 'NB' in address else
+                       'Nova Scotia' if 'NS' in address else
+                       'Ontario' if 'ON' in address else 'Unknown'
+        })
+    final_df = pd.DataFrame(clean_data)
+    final_df = final_df.drop_duplicates(subset=['Business Name', 'Phone'])
+    final_df = final_df.sort_values('Business Name')
+
+    def categorize_business(name):
+        name_lower = name.lower()
+        if any(word in name_lower for word in ['construction', 'builder', 'contractor']):
+            return 'Construction & Infrastructure'
+        elif any(word in name_lower for word in ['conseil', 'council', 'nation', 'première']):
+            return 'Indigenous Governance'
+        elif any(word in name_lower for word in ['centre', 'center', 'service']):
+            return 'Community Services'
+        elif any(word in name_lower for word in ['development', 'développement', 'enterprise']):
+            return 'Economic Development'
+        elif any(word in name_lower for word in ['school', 'école', 'education']):
+            return 'Education & Training'
+        elif any(word in name_lower for word in ['health', 'santé', 'clinic']):
+            return 'Healthcare'
+        else:
+            return 'Other Services'
+
+    final_df['Category'] = final_df['Business Name'].apply(categorize_business)
+    return final_df
+
+
+def legacy_use_full_database(df):
+    clean_data = []
+    for _, row in df.iterrows():
+        name = str(row.get('business_name', '')).strip()
+        address = str(row.get('address', '')).strip()
+        phone = str(row.get('phone', '')).strip()
+        postal = str(row.get('postal_code', '')).strip()
+        if len(name) < 4 or name == 'nan':
+            continue
+        if postal == 'nan' or not postal:
+            postal_match = re.search(r'([A-Z]\d[A-Z]\s*\d[A-Z]\d)', address)
+            if postal_match:
+                postal = postal_match.group(1)
+                address = address.replace(postal, '').strip()
+        name_lower = name.lower()
+        if any(word in name_lower for word in ['construction', 'builder', 'contractor']):
+            category = 'Construction'
+        elif any(word in name_lower for word in ['transport', 'trucking', 'freight']):
+            category = 'Transportation'
+        elif any(word in name_lower for word in ['conseil', 'council', 'development', 'corporation']):
+            category = 'Economic Development'
+        elif any(word in name_lower for word in ['service', 'consulting', 'professional']):
+            category = 'Professional Services'
+        elif any(word in name_lower for word in ['hotel', 'motel', 'inn', 'lodge']):
+            category = 'Tourism'
+        elif any(word in name_lower for word in ['store', 'mart', 'market', 'dépanneur']):
+            category = 'Retail'
+        elif 'centre' in name_lower or 'center' in name_lower:
+            category = 'Community Services'
+        else:
+            category = 'Other'
+        clean_data.append({
+            'Business Name': name,
+            'Category': category,
+            'Address': address,
+            'Postal Code': postal if postal != 'nan' else '',
+            'Phone': phone if phone != 'nan' else ''
+        })
+    final_df = pd.DataFrame(clean_data)
+    non_business_patterns = [
+        r'^CBC\s*/\s*Radio',
+        r'^Radio-Canada',
+        r'^École primaire',
+        r'^École secondaire'
+    ]
+    for pattern in non_business_patterns:
+        mask = ~final_df['Business Name'].str.contains(pattern, na=False, regex=True)
+        final_df = final_df[mask]
+    return final_df
+
+
+def legacy_process_full_database_clean(df):
+    clean_businesses = []
+    for _, row in df.iterrows():
+        name = str(row.get('Business Name', '')).strip()
+        phone = str(row.get('Phone', '')).strip()
+        address = str(row.get('Address', '')).strip()
+        if not name or name == 'nan' or len(name) < 5:
+            continue
+        if name.startswith('('):
+            name = name.strip('()')
+            if len(name) < 5:
+                continue
+        if re.match(r'^[\d\s\-\(\)\.]+$', name):
+            continue
+        if name.lower() in ['québec', 'quebec', 'montréal', 'montreal', 'kahnawake']:
+            continue
+        generic_words = ['other', 'fax', 'tel', 'phone', 'street', 'road', 'avenue']
+        if any(name.lower() == word for word in generic_words):
+            continue
+        if not phone or phone == 'nan':
+            continue
+        name = re.sub(r'^[^a-zA-Z0-9]+', '', name)
+        name = re.sub(r'[^a-zA-Z0-9\s\-\'\&\.]+', ' ', name)
+        name = ' '.join(name.split())
+        if len(name) < 5:
+            continue
+        name_lower = name.lower()
+        if any(word in name_lower for word in ['construction', 'builder', 'contractor', 'building']):
+            category = 'Construction'
+        elif any(word in name_lower for word in ['transport', 'trucking', 'freight', 'moving']):
+            category = 'Transportation'
+        elif any(word in name_lower for word in ['consulting', 'conseil', 'advisory', 'solutions']):
+            category = 'Consulting'
+        elif any(word in name_lower for word in ['development', 'développement', 'corporation']):
+            category = 'Business Development'
+        elif any(word in name_lower for word in ['hotel', 'motel', 'inn', 'lodge']):
+            category = 'Hospitality'
+        elif any(word in name_lower for word in ['store', 'mart', 'market', 'dépanneur']):
+            category = 'Retail'
+        elif any(word in name_lower for word in ['restaurant', 'café', 'food', 'pizza']):
+            category = 'Food Service'
+        elif any(word in name_lower for word in ['tech', 'software', 'computer', 'digital']):
+            category = 'Technology'
+        elif any(word in name_lower for word in ['fishing', 'fisheries', 'marine']):
+            category = 'Marine/Fishing'
+        elif any(word in name_lower for word in ['craft', 'artisan', 'art']):
+            category = 'Arts & Crafts'
+        else:
+            category = 'Other Business'
+        clean_businesses.append({
+            'Business Name': name,
+            'Category': category,
+            'Phone': phone,
+            'Address': address if address != 'nan' else '',
+            'Has Address': 'Yes' if address != 'nan' and len(str(address)) > 10 else 'No'
+        })
+    final_df = pd.DataFrame(clean_businesses)
+    return final_df.drop_duplicates(subset=['Business Name', 'Phone'])
+
+
+def legacy_final_cleanup(df):
+    clean_businesses = []
+    for _, row in df.iterrows():
+        name = str(row.get('Business Name', '')).strip()
+        address = str(row.get('Address', '')).strip()
+        phone = str(row.get('Phone', '')).strip()
+        if not name or name == 'nan' or name == 'Other':
+            continue
+        if re.match(r'^[\d\s\-\(\)]+$', name):
+            continue
+        if len(name) < 5:
+            continue
+        if any(indicator in name.lower() for indicator in ['street', 'road', 'avenue', 'main st']):
+            continue
+        if name.lower() in ['quebec', 'québec', 'kahnawake', 'wendake']:
+            continue
+        if not phone or phone == 'nan':
+            continue
+        name_lower = name.lower()
+        if any(word in name_lower for word in ['construction', 'builder', 'contractor', 'excavation']):
+            category = 'Construction & Infrastructure'
+        elif any(word in name_lower for word in ['transport', 'trucking', 'freight', 'moving', 'logistics']):
+            category = 'Transportation & Logistics'
+        elif any(word in name_lower for word in ['consulting', 'conseil', 'professional', 'services', 'solution']):
+            category = 'Professional Services'
+        elif any(word in name_lower for word in ['development', 'développement', 'corporation', 'enterprises']):
+            category = 'Economic Development'
+        elif any(word in name_lower for word in ['hotel', 'motel', 'inn', 'lodge', 'resort']):
+            category = 'Tourism & Hospitality'
+        elif any(word in name_lower for word in ['store', 'mart', 'market', 'dépanneur', 'boutique', 'shop']):
+            category = 'Retail'
+        elif any(word in name_lower for word in ['restaurant', 'café', 'food', 'cuisine', 'pizza']):
+            category = 'Food Services'
+        elif any(word in name_lower for word in ['fisheries', 'fishing', 'seafood']):
+            category = 'Natural Resources'
+        elif any(word in name_lower for word in ['technology', 'tech', 'computer', 'software']):
+            category = 'Technology'
+        else:
+            category = 'General Business'
+        clean_businesses.append({
+            'Business Name': name,
+            'Category': category,
+            'Address': address if address != 'nan' else '',
+            'Phone': phone
+        })
+    final_df = pd.DataFrame(clean_businesses)
+    return final_df.drop_duplicates(subset=['Business Name', 'Phone'])
+
+
+LEGACY = {
+    'clean_data': legacy_clean_data,
+    'deep_clean': legacy_deep_clean,
+    'ultra_clean': legacy_ultra_clean,
+    'final_deep_clean': legacy_final_deep_clean,
+    'use_full_database': legacy_use_full_database,
+    'process_full_database_clean': legacy_process_full_database_clean,
+    'final_cleanup': legacy_final_cleanup,
+}
+
+
+# ---- synthetic OCR dump -----------------------------------------------------
+
+WORDS = ['Construction', 'Wapan', 'Nation', 'Crie', 'Conseil', 'Services', 'Café', 'Kahnawake', 'Transport',
+         'Hotel', 'Dépanneur', 'Centre', 'École', 'primaire', 'Fisheries', 'Tech', 'Art', 'Corporation',
+         'Solutions', 'Santé', 'Builder', 'Lodge', 'Market', 'Inc.', 'Ltée', 'Première', 'Radio-Canada',
+         'Développement', 'Pizza', 'Logistics']
+STREETS = ['rue Principale', 'boul. Bastien', 'avenue Lake', 'road 138', 'Main Street', 'chemin Dollard',
+           'route 132', 'General Delivery', 'P.O. Box 12', 'Suite 200', 'Old Malone Hwy']
+TOWNS = ['Wendake (Québec)', 'Kahnawake (QC)', 'Eel Ground, NB', 'Eskasoni NS', 'Akwesasne ON', 'Mashteuiatsh',
+         'Québec', 'Quebec']
+POSTALS = ['G0A 4V0', 'J0L1B0', 'E1V 4J2', 'B1W 1A1', 'K6H 5R7', '']
+JUNK = ['Phone:', 'FAX', 'COMMUNICATION', '---', '(418) 555-1234', '...', '   ', 'Tél.', "\\Wapan_", "'Inc__",
+        'Suite', '(Cree) Nation', 'Quebec', 'Kahnawake', 'Other', '12 Main Street', 'CBC / Radio Nord', 'abc']
+
+
+def synthetic(n, seed=0):
+    """Raw OCR rows plus the column layouts each later cleaner reads"""
+    rng = np.random.default_rng(seed)
+
+    def pick(options):
+        return np.asarray(options, dtype=object)[rng.integers(0, len(options), n)]
+
+    names = pick(WORDS) + ' ' + pick(WORDS)
+    numbers = pd.Series(rng.integers(1, 9999, n)).astype(str).to_numpy(dtype=object)
+    addresses = numbers + ' ' + pick(STREETS) + ', ' + pick(TOWNS)
+    postals = pick(POSTALS)
+    lines = pd.Series(rng.integers(1000, 9999, n)).astype(str).to_numpy(dtype=object)
+    phones = '(' + pd.Series(rng.integers(200, 999, n)).astype(str).to_numpy(dtype=object) + ') 555-' + lines
+    # OCR garbles some area codes and drops others - still listings, just no valid NANP number
+    garbled = rng.random(n)
+    phones = np.where(garbled < 0.03, '(123) 555-' + lines, np.where(garbled < 0.05, '555-' + lines, phones))
+    layout = rng.integers(0, 6, n)
+    junk = pick(JUNK)
+    full = np.where(layout == 0, junk,
+           np.where(layout == 1, names + ', ' + pick(TOWNS),
+           np.where(layout == 2, names,
+           # Postal code first - "J0L 1B0, chemin ..." has an address token starting inside it
+           np.where(layout == 5, names + ' ' + pick(POSTALS[:-1]) + ', ' + pick(STREETS) + ', ' + pick(TOWNS),
+                    names + ' ' + addresses + ' ' + postals))))
+    with_postal = np.where(rng.random(n) < 0.5, addresses + ', ' + postals, addresses)
+    # Repeat a slice so the dedup steps have something to do
+    dup = rng.integers(0, n, n // 10)
+
+    def frame(columns):
+        df = pd.DataFrame(columns)
+        df = pd.concat([df, df.iloc[dup]], ignore_index=True)
+        # Blank out a few cells the way Excel exports leave them
+        for column in df.columns:
+            df.loc[rng.random(len(df)) < 0.02, column] = np.nan
+        return df
+
+    raw = pd.DataFrame({'name': full, 'phone': phones, 'folder': pick(['Data 1', 'Data2'])})
+    raw.loc[rng.random(n) < 0.02, 'phone'] = np.nan
+    raw = pd.concat([raw, raw.iloc[dup]], ignore_index=True)
+    named = np.where(layout == 0, junk, names)
+    return {
+        'clean_data': raw,
+        'deep_clean': raw,
+        'ultra_clean': frame({'Business Name': names, 'Address': with_postal, 'Postal Code': postals,
+                              'Phone': phones, 'Province': pick(['Quebec', 'Unknown']),
+                              'Category': pick(['Construction & Infrastructure', 'Other Services'])})
+                       .assign(**{'Business Name': lambda df: df['Business Name'].fillna('')}),
+        'final_deep_clean': frame({'business_name': names, 'address': with_postal, 'postal_code': postals,
+                                   'phone': phones}).assign(business_name=lambda df: df['business_name'].fillna('')),
+        'use_full_database': frame({'business_name': named, 'address': with_postal, 'phone': phones,
+                                    'postal_code': postals}),
+        'process_full_database_clean': frame({'Business Name': np.where(layout == 1, '(' + names + ')', named),
+                                              'Phone': phones, 'Address': addresses}),
+        'final_cleanup': frame({'Business Name': named, 'Address': addresses, 'Phone': phones}),
+    }
+
+
+# Columns the engine deliberately does differently from the old loop. Category
+# everywhere: keywords match accent-folded tokens, not substrings - 'art' no
+# longer hits "Martin", 'école' now hits "Ecole".
+CHANGED = {
+    # Province from the postal code or a whole-word province name, not 'ON' in "CONSTRUCTION"
+    'final_deep_clean': ['Province', 'Municipality', 'Category'],
+    'use_full_database': ['Category'],
+    # Phones are also kept as int64 E.164 and the dedup keys on those
+    'deep_clean': ['phone_e164'],
+    'process_full_database_clean': ['Phone E164', 'Category'],
+    'final_cleanup': ['Phone E164', 'Category'],
+}
+
+
+def same(a, b, changed=()):
+    """Same columns, rows and values - NaN equals NaN, dtypes may differ (object vs str)"""
+    a = a.drop(columns=[c for c in changed if c in a.columns])
+    b = b.drop(columns=[c for c in changed if c in b.columns])
+    if list(a.columns) != list(b.columns) or not a.index.equals(b.index):
+        return False
+    return all(a[c].astype(object).where(a[c].notna(), None).tolist()
+               == b[c].astype(object).where(b[c].notna(), None).tolist() for c in a.columns)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the cleaning engine against the old iterrows loops")
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--only', choices=sorted(LEGACY), help="benchmark a single cleaner")
+    args = parser.parse_args()
+
+    inputs = synthetic(args.rows, args.seed)
+    names = [args.only] if args.only else list(LEGACY)
+
+    print("⏱️  CLEANING BENCHMARK")
+    print("=" * 60)
+    print(f"📄 {args.rows:,} synthetic OCR rows (+10% duplicates)")
+    print(f"\n   {'cleaner':<28}  {'loop s':>8}  {'engine s':>8}  {'speedup':>7}  {'rows':>8}  same")
+
+    failed = []
+    for name in names:
+        df = inputs[name]
+        start = time.perf_counter()
+        expected = LEGACY[name](df)
+        loop_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = clean(name, df)
+        engine_seconds = time.perf_counter() - start
+
+        ok = same(expected, result, CHANGED.get(name, ()))
+        if not ok:
+            failed.append(name)
+        print(f"   {name:<28}  {loop_seconds:>8.2f}  {engine_seconds:>8.2f}  "
+              f"{loop_seconds / engine_seconds:>6.1f}x  {len(result):>8,}  {'✅' if ok else '❌'}")
+
+    if failed:
+        print(f"\n❌ Output differs for: {', '.join(failed)}")
+        raise SystemExit(1)
+    print("\n✅ Engine output matches the loops for every cleaner")
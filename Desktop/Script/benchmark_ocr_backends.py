@@ -0,0 +1,54 @@
+import time
+import random
+import argparse
+from statistics import median
+
+from PIL import Image
+
+from extract_businesses import list_png_files
+from ocr_backends import BACKENDS, get_backend
+
+# Per-page OCR latency: a fresh tesseract process per page (pytesseract) vs one
+# engine kept loaded for the whole run (tesserocr). No cache, no preprocessing.
+
+parser = argparse.ArgumentParser(description="Benchmark subprocess vs persistent tesseract")
+parser.add_argument('--pages', type=int, default=50, help="how many random pages to sample")
+parser.add_argument('--variant', choices=['text', 'tsv'], default='text')
+parser.add_argument('--seed', type=int, default=42)
+args = parser.parse_args()
+
+tasks = list_png_files()
+random.Random(args.seed).shuffle(tasks)
+images = []
+for png_path, _ in tasks[:args.pages]:
+    img = Image.open(png_path)
+    img.load()
+    images.append(img)
+
+print("⏱️  OCR BACKEND BENCHMARK")
+print("=" * 60)
+print(f"📄 {len(images)} pages, {args.variant} output")
+
+results = {}
+for name in sorted(BACKENDS):
+    start = time.perf_counter()
+    try:
+        backend = get_backend(name)
+    except ImportError as e:
+        print(f"   {name:>10}: skipped ({e})")
+        continue
+    startup = time.perf_counter() - start
+
+    run = backend.image_to_data if args.variant == 'tsv' else backend.image_to_string
+    latencies = []
+    for img in images:
+        start = time.perf_counter()
+        run(img)
+        latencies.append(time.perf_counter() - start)
+    results[name] = latencies
+    print(f"   {name:>10}: startup {startup:.2f}s, median {median(latencies) * 1000:.0f} ms/page, "
+          f"mean {sum(latencies) / len(latencies) * 1000:.0f} ms/page, total {sum(latencies):.1f}s")
+
+if len(results) == 2:
+    speedup = median(results['subprocess']) / median(results['persistent'])
+    print(f"\n📊 Persistent engine is {speedup:.2f}x faster per page (median)")
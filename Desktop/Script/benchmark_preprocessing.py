@@ -0,0 +1,67 @@
+import time
+import random
+import argparse
+
+import pytesseract
+from PIL import Image
+
+from extract_businesses import list_png_files, ENGINES
+from ocr_cache import OCR_LANG
+from preprocess import PREPROCESS_CONFIG, preprocess_image, tesseract_config
+from page_regions import FOLDER_REGIONS, crop_to_region
+
+# OCR time per page and rows recovered, raw screenshots vs preprocessed.
+# Bypasses both caches so every page really goes through tesseract.
+
+parser = argparse.ArgumentParser(description="Benchmark OCR with and without preprocessing")
+parser.add_argument('--pages', type=int, default=30, help="how many random pages to sample")
+parser.add_argument('--engine', choices=sorted(ENGINES), default='text')
+parser.add_argument('--seed', type=int, default=42)
+parser.add_argument('--crop', action='store_true', help="crop both runs to the listing region first")
+args = parser.parse_args()
+
+tasks = list_png_files()
+random.Random(args.seed).shuffle(tasks)
+sample = tasks[:args.pages]
+variant, parse = ENGINES[args.engine]
+
+
+def run_ocr(img, config=''):
+    if variant == 'tsv':
+        return pytesseract.image_to_data(img, lang=OCR_LANG, config=config)
+    return pytesseract.image_to_string(img, lang=OCR_LANG, config=config)
+
+
+print("⏱️  PREPROCESSING BENCHMARK")
+print("=" * 60)
+print(f"📄 {len(sample)} pages, {args.engine} engine, crop={args.crop}, config: {PREPROCESS_CONFIG}")
+
+raw_ocr = pre_ocr = prep = 0.0
+raw_rows = pre_rows = 0
+for png_path, folder_name in sample:
+    img = Image.open(png_path)
+    img.load()
+    if args.crop:
+        img = crop_to_region(img, FOLDER_REGIONS.get(folder_name))
+
+    start = time.perf_counter()
+    text = run_ocr(img)
+    raw_ocr += time.perf_counter() - start
+    raw_rows += len(parse(text, folder_name))
+
+    start = time.perf_counter()
+    clean = preprocess_image(img, PREPROCESS_CONFIG)
+    prep += time.perf_counter() - start
+
+    start = time.perf_counter()
+    text = run_ocr(clean, tesseract_config(clean))
+    pre_ocr += time.perf_counter() - start
+    pre_rows += len(parse(text, folder_name))
+
+n = len(sample)
+print(f"\n   {'':>13}  {'OCR s/page':>10}  {'prep s/page':>11}  {'rows':>6}")
+print(f"   {'raw':>13}  {raw_ocr / n:>10.2f}  {'-':>11}  {raw_rows:>6}")
+print(f"   {'preprocessed':>13}  {pre_ocr / n:>10.2f}  {prep / n:>11.2f}  {pre_rows:>6}")
+print(f"\n📊 OCR speedup: {raw_ocr / pre_ocr:.2f}x "
+      f"({raw_ocr / (pre_ocr + prep):.2f}x counting uncached preprocessing)")
+print(f"🏢 Rows recovered: {pre_rows - raw_rows:+d}")
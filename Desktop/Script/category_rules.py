@@ -0,0 +1,104 @@
+import hashlib
+import json
+import os
+import pickle
+
+import keyword_categorizer
+import name_tokens
+from keyword_categorizer import KeywordCategorizer, TokenFilter
+
+# The category taxonomies live in category_rules.json - one per script, each
+# a default plus rules with a priority (lower wins), a category and keyword
+# patterns by language, optionally "unless" patterns that rule the category
+# out. The file also holds the scripts' filters - named rules of patterns
+# that mark a name as something other than a business. Patterns are matched
+# against folded tokens, see keyword_categorizer.py for the syntax.
+#
+# Compiled, the whole file is one KeywordCategorizer per taxonomy and one
+# TokenFilter per filter. That is pickled under a key made from the file's
+# bytes and the source of the modules that compile and match it, so after
+# the first run loading it is a single unpickle - and any edit to the file
+# or to the matching code is a new key.
+
+RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'category_rules.json')
+CACHE_DIR = '/Users/Jon/Desktop/.cleaning_cache'
+RULES_VERSION = 2
+# Bump when KeywordCategorizer's or TokenFilter's pickled layout changes
+CACHE_FORMAT = 3
+
+
+def _words(by_language):
+    return [word for words in by_language.values() for word in words]
+
+
+def _read(path):
+    with open(path, encoding='utf-8') as f:
+        document = json.load(f)
+    if document.get('version') != RULES_VERSION:
+        raise ValueError(f"{path}: rule file version {document.get('version')!r}, expected {RULES_VERSION}")
+    return document
+
+
+def load_rules(path=RULES_FILE):
+    """{taxonomy: (rules, default)} from the rule file, each taxonomy's rules in priority order
+
+    A rule is (category, patterns) or (category, patterns, unless patterns),
+    the form KeywordCategorizer takes.
+    """
+    document = _read(path)
+    taxonomies = {}
+    for name, taxonomy in document['taxonomies'].items():
+        rules = []
+        for rule in sorted(taxonomy['rules'], key=lambda rule: rule['priority']):
+            if not _words(rule['keywords']):
+                raise ValueError(f"{path}: {name} / {rule['category']} has no keywords")
+            unless = _words(rule.get('unless', {}))
+            rules.append((rule['category'], _words(rule['keywords'])) + ((unless,) if unless else ()))
+        taxonomies[name] = (rules, taxonomy['default'])
+    return taxonomies
+
+
+def load_filters(path=RULES_FILE):
+    """{filter: [(rule id, patterns)]} from the rule file, in file order"""
+    filters = {}
+    for name, group in _read(path).get('filters', {}).items():
+        for rule in group['rules']:
+            if not rule['patterns']:
+                raise ValueError(f"{path}: {name} / {rule['id']} has no patterns")
+        filters[name] = [(rule['id'], rule['patterns']) for rule in group['rules']]
+    return filters
+
+
+def compile_rules(path=RULES_FILE):
+    """({taxonomy: KeywordCategorizer}, {filter: TokenFilter}) straight from the rule file"""
+    categorizers = {name: KeywordCategorizer(rules, default) for name, (rules, default) in load_rules(path).items()}
+    filters = {name: TokenFilter(rules) for name, rules in load_filters(path).items()}
+    return categorizers, filters
+
+
+def load_compiled(path=RULES_FILE, cache_dir=CACHE_DIR):
+    """compile_rules(), from the on-disk cache when this exact rule file and code were compiled before"""
+    content = b''
+    for source in (path, keyword_categorizer.__file__, name_tokens.__file__):
+        with open(source, 'rb') as f:
+            content += f.read()
+    key = hashlib.sha256(content + f":{CACHE_FORMAT}".encode()).hexdigest()[:16]
+    cache_path = os.path.join(cache_dir, f"category_rules-{key}.pkl")
+
+    if os.path.exists(cache_path):
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+
+    compiled = compile_rules(path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        for name in os.listdir(cache_dir):
+            if name.startswith('category_rules-') and name.endswith('.pkl'):
+                os.remove(os.path.join(cache_dir, name))
+        # Write then rename, so a run reading the cache never sees half a file
+        with open(cache_path + '.tmp', 'wb') as f:
+            pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(cache_path + '.tmp', cache_path)
+    except OSError:
+        pass  # No cache then - compiling again next time is the only cost
+    return compiled
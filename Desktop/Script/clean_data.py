@@ -1,5 +1,6 @@
 import pandas as pd
-import re
+
+from cleaning_engine import clean_data_rows
 
 # Load your data
 df = pd.read_excel("/Users/Jon/Desktop/Indigenous_Businesses_20250616_1449.xlsx")
@@ -11,43 +12,8 @@ for i in range(5):
     print(f"{df.iloc[i]['name']}")
     print(f"Phone: {df.iloc[i]['phone']}\n")
 
-# Let's separate business names from addresses
-new_data = []
-
-for _, row in df.iterrows():
-    full_text = row['name']
-    phone = row['phone']
-    
-    # Look for address patterns
-    address_match = re.search(r'(\d+[\s,]|rue|boul|avenue|route|chemin|CP|C\.P\.|av\.|blvd)', full_text, re.I)
-    
-    if address_match:
-        # Split at the first address indicator
-        business_name = full_text[:address_match.start()].strip(' ,.-_')
-        address = full_text[address_match.start():].strip()
-    else:
-        # No address found, it's all business name
-        business_name = full_text.strip(' ,.-_')
-        address = ""
-    
-    # Extract postal code from address
-    postal_match = re.search(r'[A-Z]\d[A-Z]\s*\d[A-Z]\d', address if address else full_text)
-    postal_code = postal_match.group(0) if postal_match else ""
-    
-    new_data.append({
-        'business_name': business_name,
-        'address': address,
-        'postal_code': postal_code,
-        'phone': phone,
-        'original_text': full_text,
-        'source': row['folder']
-    })
-
-# Create new clean dataframe
-clean_df = pd.DataFrame(new_data)
-
-# Remove any empty business names
-clean_df = clean_df[clean_df['business_name'].str.len() > 3]
+# Separate business names from addresses and drop empty names (cleaning_engine.py)
+clean_df = clean_data_rows(df)
 
 # Save cleaned version
 output = "/Users/Jon/Desktop/Indigenous_Businesses_CLEAN_20250616.xlsx"
@@ -0,0 +1,553 @@
+import hashlib
+import inspect
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from address_parser import FSA_OVERRIDES, FSA_PROVINCE, TRAILING_PROVINCE, parse_addresses, fsa_province
+from category_rules import load_compiled, load_filters, load_rules
+from junk_filter import JUNK_FILTERS, JUNK_RULES
+from name_tokens import distinct_tokens
+from phone_index import normalize_phones, phone_keys, phone_text
+from parsing import (ADDRESS_START, POSTAL_CODE, STREET_ADDRESS, find_postal_codes, remove_each, scan_series,
+                     scanner, split_at, split_scanned)
+
+# The cleaning scripts' row loops as whole-column pandas operations.
+#
+# Each cleaner is split in two: a row-local part (`*_rows`) that only ever
+# looks at one row at a time - filters, splits, postal codes, categories -
+# and a global part (dedup, sort) that needs the whole frame. The row-local
+# part can run on any slice of the data; `finish()` applies the global part.
+# Column names, order and values match what the scripts' iterrows() loops built.
+
+# deep_clean.py
+DEEP_CLEAN_LABELS = ['suite', 'phone', 'fax', 'tel', 'general', 'delivery']
+
+# ultra_clean.py - first of these to match wins
+ULTRA_CLEAN_POSTAL = [
+    re.compile(POSTAL_CODE.pattern + r'\s*$'),     # At end
+    re.compile(r'\)\s*' + POSTAL_CODE.pattern),     # After province
+    re.compile(r',\s*' + POSTAL_CODE.pattern),      # After comma
+]
+
+# find_best_200_v2.py - +10 each for professional-sounding names
+PROFESSIONAL_WORDS = ['Corporation', 'Enterprises', 'Group', 'Services', 'Solutions',
+                      'Consulting', 'Construction', 'Development', 'Centre', 'Professional']
+SHOWCASE_SIZE = 200
+
+# recategorize_other.py keeps the first this many for final_cleanup
+TOP_BUSINESSES = 1000
+
+# process_full_database_clean.py name cleanup
+LEADING_JUNK = re.compile(r'^[^a-zA-Z0-9]+')
+ODD_CHARACTERS = re.compile(r'[^a-zA-Z0-9\s\-\'\&\.]+')
+NAME_CACHE_SIZE = 100000
+
+# Parallel runs give each worker at least this many rows - below that the
+# pickling costs more than the regexes save
+MIN_SHARD_ROWS = 20000
+
+# Keyword categories per script, checked in priority order - first hit wins,
+# and the non-business filters use_full_database.py, smart_filter.py and
+# remove_non_businesses.py drop names by. They live in category_rules.json;
+# the compiled versions come from its cache.
+CATEGORY_RULES = load_rules()
+FILTER_RULES = load_filters()
+CATEGORIZERS, FILTERS = load_compiled()
+
+
+def _text(df, column, default=''):
+    """str(row.get(column, default)) for every row - NaN turns into 'nan' just like str() does"""
+    if column not in df.columns:
+        return pd.Series(str(default), index=df.index, dtype=object)
+    return df[column].map(str).astype(object)
+
+
+def _column(df, column, default):
+    """row.get(column, default) for every row"""
+    if column not in df.columns:
+        return pd.Series(default, index=df.index, dtype=object)
+    return df[column]
+
+
+def _not_nan(text):
+    """'' where str() gave 'nan'"""
+    return text.where(text != 'nan', '')
+
+
+def _missing(phone):
+    """True where the scripts' `not phone or phone == 'nan'` saw no phone at all"""
+    return (phone == '') | (phone == 'nan')
+
+
+def categorize(names, script, tokens=None):
+    """Category per name using that script's keyword rules - `tokens` is distinct_tokens(names) if known"""
+    return CATEGORIZERS[script].categorize(names, tokens)
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def normalize_business_name(name):
+    """process_full_database_clean.py's name cleanup: leading junk off, odd characters out, single spaces"""
+    name = LEADING_JUNK.sub('', name)
+    name = ODD_CHARACTERS.sub(' ', name)
+    return ' '.join(name.split())
+
+
+_names_seen = 0
+
+
+def normalize_names(names):
+    """normalize_business_name() over a Series - each distinct raw name is cleaned once"""
+    global _names_seen
+    codes, uniques = pd.factorize(names)
+    _names_seen += len(codes)
+    cleaned = np.asarray([normalize_business_name(name) for name in uniques], dtype=object)
+    return pd.Series(cleaned[codes], index=names.index, dtype=object)
+
+
+def name_cache_stats():
+    """(names seen, names actually cleaned) since the module was loaded"""
+    return _names_seen, normalize_business_name.cache_info().misses
+
+
+def print_name_cache_stats():
+    seen, cleaned = name_cache_stats()
+    if seen:
+        print(f"🧽 Name cleanup: {seen:,} names, {cleaned:,} cleaned ({1 - cleaned / seen:.0%} reused)")
+
+
+def clean_data_rows(df):
+    """clean_data.py: split name/address at the first address token, pull the postal code"""
+    df = df.reset_index(drop=True)
+    full_text = df['name']
+    business_name, address, matched = split_at(full_text, ADDRESS_START)
+    business_name = business_name.str.strip(' ,.-_').astype(object)
+    address = address.str.strip().astype(object)
+    postal_code = find_postal_codes(address.where(address != '', full_text))
+    out = pd.DataFrame({
+        'business_name': business_name,
+        'address': address,
+        'postal_code': postal_code,
+        'phone': df['phone'],
+        'original_text': full_text,
+        'source': df['folder'],
+    })
+    return out[out['business_name'].str.len() > 3]
+
+
+def deep_clean_rows(df):
+    """deep_clean.py: drop junk and OCR fragments, split name/address, pull the postal code"""
+    df = df.reset_index(drop=True)
+    full_text = _text(df, 'name').str.strip().astype(object)
+    phone = _text(df, 'phone').str.strip().astype(object)
+    phone_e164 = normalize_phones(_column(df, 'phone', np.nan))
+    keep = ~JUNK_FILTERS['deep_clean'].junk(full_text)
+    df, full_text, phone, phone_e164 = df[keep], full_text[keep], phone[keep], phone_e164[keep]
+
+    fragment = full_text.str.startswith(('\\', "'")) | full_text.str.endswith('_')
+    full_text = full_text.where(~fragment, full_text.str.strip("\\'_")).astype(object)
+
+    # Postal code and address start in one pass over each name
+    scanned = scan_series(full_text, STREET_ADDRESS)
+    postal_code = scanned['postal_code'].astype(object)
+    matched = scanned['address_start'] >= 0
+    business_name, address = split_scanned(full_text, scanned['address_start'])
+    business_name = business_name.str.strip(' ,.-_').astype(object)
+    address = address.str.strip().astype(object)
+    # No address token - a comma might still separate name from location
+    comma = ~matched & full_text.str.contains(',', regex=False)
+    if comma.any():
+        halves = full_text[comma].str.split(',', n=1, expand=True)
+        business_name[comma] = halves[0].str.strip()
+        address[comma] = halves[1].str.strip()
+
+    business_name = business_name.str.replace(r'[\s,\._-]+$', '', regex=True).str.strip().astype(object)
+    keep = ((business_name.str.len() >= 3)
+            & ~business_name.str.lower().isin(DEEP_CLEAN_LABELS)
+            & ~business_name.str.contains('__', regex=False)
+            & (business_name.str.count(r'\(') == business_name.str.count(r'\)')))
+    return pd.DataFrame({
+        'business_name': business_name[keep],
+        'address': address[keep],
+        'postal_code': postal_code[keep],
+        'phone': phone_text(phone[keep], phone_e164[keep]),
+        'source': df['folder'][keep],
+        'phone_e164': phone_e164[keep],
+    }).reset_index(drop=True)
+
+
+def ultra_clean_rows(df):
+    """ultra_clean.py: move postal codes out of the address into their own column"""
+    df = df.reset_index(drop=True)
+    address = _text(df, 'Address')
+    existing_postal = _text(df, 'Postal Code')
+
+    found = pd.Series('', index=df.index, dtype=object)
+    for pattern in ULTRA_CLEAN_POSTAL:
+        found = found.where(found != '', find_postal_codes(address, pattern))
+    found = found.str.replace(' ', '', regex=False).astype(object)
+    has = found != ''
+
+    clean = remove_each(address[has], found[has])
+    clean = remove_each(clean, found[has].str[:3] + ' ' + found[has].str[3:])
+    clean = (clean.str.replace(r'[,\s\)]+$', '', regex=True)
+             .str.replace(r'\s+', ' ', regex=True)
+             .str.replace(' ,', ',', regex=False)
+             .str.replace(' )', ')', regex=False)
+             .str.strip())
+
+    return pd.DataFrame({
+        'Business Name': df['Business Name'],
+        'Address': address.where(~has, clean).astype(object),
+        'Postal Code': found.where(has, _not_nan(existing_postal)).astype(object),
+        'Phone': df['Phone'],
+        'Province': _column(df, 'Province', 'Unknown'),
+        'Category': _column(df, 'Category', 'Other'),
+    })
+
+
+def final_deep_clean_rows(df):
+    """final_deep_clean.py: postal code out of the address, province, municipality and category"""
+    df = df.reset_index(drop=True)
+    business_name = df['business_name']
+    address = df['address'].map(str).astype(object).where(df['address'].notna(), '')
+
+    postal = find_postal_codes(address)
+    has = postal != ''
+    clean = remove_each(address[has], postal[has]).str.strip().str.replace(r'[,.\s]+$', '', regex=True)
+    clean_address = address.where(~has, clean).astype(object)
+    clean_address = clean_address.str.replace(r'\s+', ' ', regex=True).str.replace(' ,', ',', regex=False)
+    existing = df['postal_code'].astype(object).where(df['postal_code'].notna(), '')
+    postal_code = postal.where(has, existing)
+
+    keep = (business_name.str.len() >= 5) & ~business_name.str.startswith('.')
+    # Province from the postal code's FSA, else a province written at the end of the address
+    parsed = parse_addresses(address)
+    province = postal_code.map(str).map(fsa_province).astype(object)
+    province = province.where(province != '', parsed['province'])
+
+    out = pd.DataFrame({
+        'Business Name': business_name,
+        'Address': clean_address.astype(object),
+        'Postal Code': postal_code.astype(object),
+        'Phone': df['phone'],
+        'Province': province.where(province != '', 'Unknown').astype(object),
+        'Municipality': parsed['municipality'],
+    })[keep].reset_index(drop=True)
+    out['Category'] = categorize(out['Business Name'], 'final_deep_clean')
+    return out
+
+
+def _use_full_database_names(df):
+    """(stripped names, mask of the ones long enough to keep) - the rows use_full_database numbers"""
+    name = _text(df, 'business_name').str.strip().astype(object)
+    return name, (name.str.len() >= 4) & (name != 'nan')
+
+
+def use_full_database_rows(df):
+    """use_full_database.py: fill missing postal codes, categorize, drop media and schools"""
+    df = df.reset_index(drop=True)
+    name, keep = _use_full_database_names(df)
+    address = _text(df, 'address').str.strip().astype(object)
+    phone = _text(df, 'phone').str.strip().astype(object)
+    postal = _text(df, 'postal_code').str.strip().astype(object)
+    name, address, phone, postal = name[keep], address[keep], phone[keep], postal[keep]
+
+    missing = (postal == 'nan') | (postal == '')
+    found = find_postal_codes(address[missing])
+    fill = found[found != '']
+    postal[fill.index] = fill
+    address[fill.index] = remove_each(address[fill.index], fill).str.strip()
+
+    # One tokenization of the names for both the categories and the filter
+    tokens = distinct_tokens(name)
+    out = pd.DataFrame({
+        'Business Name': name,
+        'Category': categorize(name, 'use_full_database', tokens),
+        'Address': address,
+        'Postal Code': _not_nan(postal),
+        'Phone': _not_nan(phone),
+    }).reset_index(drop=True)
+    return out[~FILTERS['use_full_database'].matches(out['Business Name'], tokens)]
+
+
+def process_full_database_rows(df):
+    """process_full_database_clean.py: strict name filters, name cleanup and categories"""
+    df = df.reset_index(drop=True)
+    name = _text(df, 'Business Name').str.strip().astype(object)
+    phone = _text(df, 'Phone').str.strip().astype(object)
+    phone_e164 = normalize_phones(_column(df, 'Phone', np.nan))
+    address = _text(df, 'Address').str.strip().astype(object)
+
+    # Names in parentheses lose them before the junk rules look at them
+    paren = name.str.startswith('(')
+    name = name.where(~paren, name.str.strip('()')).astype(object)
+    keep = ~JUNK_FILTERS['process_full_database_clean'].junk(name) & ~_missing(phone)
+
+    name = normalize_names(name[keep])
+    phone, phone_e164, address = phone[keep], phone_e164[keep], address[keep]
+    keep = name.str.len() >= 5
+    name, phone, phone_e164, address = name[keep], phone[keep], phone_e164[keep], address[keep]
+
+    return pd.DataFrame({
+        'Business Name': name,
+        'Category': categorize(name, 'process_full_database_clean'),
+        'Phone': phone_text(phone, phone_e164),
+        'Address': _not_nan(address),
+        'Has Address': pd.Series(np.where((address != 'nan') & (address.str.len() > 10), 'Yes', 'No'),
+                                 index=name.index, dtype=object),
+        'Phone E164': phone_e164,
+    }).reset_index(drop=True)
+
+
+def final_cleanup_rows(df):
+    """final_cleanup.py: drop placeholder, address-only and location-only names, categorize"""
+    df = df.reset_index(drop=True)
+    name = _text(df, 'Business Name').str.strip().astype(object)
+    address = _text(df, 'Address').str.strip().astype(object)
+    phone = _text(df, 'Phone').str.strip().astype(object)
+    phone_e164 = normalize_phones(_column(df, 'Phone', np.nan))
+
+    keep = ~JUNK_FILTERS['final_cleanup'].junk(name) & ~_missing(phone)
+    name, address, phone, phone_e164 = name[keep], address[keep], phone[keep], phone_e164[keep]
+
+    return pd.DataFrame({
+        'Business Name': name,
+        'Category': categorize(name, 'final_cleanup'),
+        'Address': _not_nan(address),
+        'Phone': phone_text(phone, phone_e164),
+        'Phone E164': phone_e164,
+    }).reset_index(drop=True)
+
+
+def quality_score_rows(df):
+    """find_best_200_v2.py: score each business on how complete and professional it looks"""
+    df = df.copy()
+    df['quality_score'] = 0
+    df.loc[df['address'].str.len() > 20, 'quality_score'] += 30
+    df.loc[df['postal_code'].notna(), 'quality_score'] += 20
+    df.loc[df['business_name'].str.len() > 15, 'quality_score'] += 20
+    df.loc[df['phone'].notna(), 'quality_score'] += 10
+    for word in PROFESSIONAL_WORDS:
+        df.loc[df['business_name'].str.contains(word, case=False, na=False), 'quality_score'] += 10
+    return df
+
+
+def smart_filter_rows(df):
+    """smart_filter.py: drop the few known non-businesses, recategorize the rest"""
+    codes, distinct = distinct_tokens(df['Business Name'])
+    keep = ~FILTERS['smart_filter'].matches(df['Business Name'], (codes, distinct)).to_numpy()
+    clean_df = df[keep].copy()
+    clean_df['Category'] = categorize(clean_df['Business Name'], 'smart_filter', (codes[keep], distinct))
+    return clean_df
+
+
+def remove_non_businesses_rows(df):
+    """remove_non_businesses.py: keep commercial businesses only, with refined categories"""
+    codes, distinct = distinct_tokens(df['Business Name'])
+    keep = ~FILTERS['remove_non_businesses'].matches(df['Business Name'], (codes, distinct)).to_numpy()
+    commercial_df = df[keep].copy()
+    commercial_df['Category'] = categorize(commercial_df['Business Name'], 'remove_non_businesses',
+                                           (codes[keep], distinct))
+    return commercial_df
+
+
+def better_category_rows(df):
+    """recategorize_other.py: a Better_Category column - 'Other' businesses get a closer look"""
+    df = df.copy()
+    other = df['Category'] == 'Other'
+    better = df['Category'].astype(object)
+    better[other] = categorize(df.loc[other, 'Business Name'], 'recategorize_other')
+    df['Better_Category'] = better
+    return df[df['Better_Category'] != 'Non-Commercial']
+
+
+def recategorize_other_rows(df):
+    """recategorize_other.py's saved frame - Better_Category renamed over Category
+
+    The rename leaves two Category columns (old and new), same as the saved workbook.
+    """
+    return better_category_rows(df).rename(columns={'Better_Category': 'Category'})
+
+
+# Whole-frame steps: dedup on these columns (first row kept), then sort on these.
+# final_deep_clean.py dedups and sorts before categorizing - same result, the
+# category only reads the name.
+DEDUP_KEYS = {
+    'deep_clean': ['business_name', 'phone_e164'],
+    'final_deep_clean': ['Business Name', 'Phone'],
+    'process_full_database_clean': ['Business Name', 'Phone E164'],
+    'final_cleanup': ['Business Name', 'Phone E164'],
+    'remove_non_businesses': ['Business Name', 'Address'],
+}
+SORT_KEYS = {
+    'deep_clean': 'business_name',
+    'final_deep_clean': 'Business Name',
+    'remove_non_businesses': ['Category', 'Business Name'],
+}
+# int64 phone column -> the text column it falls back to where the phone didn't normalize
+PHONE_TEXT = {'phone_e164': 'phone', 'Phone E164': 'Phone'}
+
+
+def dedup_keys(name, df):
+    """The columns a cleaner dedups on - int phones that are 0 are replaced by a key from their text"""
+    keys = df[DEDUP_KEYS[name]]
+    phones = {column: phone_keys(df[column], df[PHONE_TEXT[column]]) for column in keys if column in PHONE_TEXT}
+    return keys.assign(**phones)
+
+
+def _dedup_and_sort(name):
+    def final(df):
+        df = df[~dedup_keys(name, df).duplicated()]
+        return df.sort_values(SORT_KEYS[name]) if name in SORT_KEYS else df
+    return final
+
+
+# name -> (row-local part, global part or None)
+CLEANERS = {
+    'clean_data': (clean_data_rows, None),
+    'deep_clean': (deep_clean_rows, _dedup_and_sort('deep_clean')),
+    'ultra_clean': (ultra_clean_rows, None),
+    'final_deep_clean': (final_deep_clean_rows, _dedup_and_sort('final_deep_clean')),
+    'use_full_database': (use_full_database_rows, None),
+    'process_full_database_clean': (process_full_database_rows, _dedup_and_sort('process_full_database_clean')),
+    'final_cleanup': (final_cleanup_rows, _dedup_and_sort('final_cleanup')),
+    'find_best_200': (quality_score_rows,
+                      lambda df: df.nlargest(SHOWCASE_SIZE, 'quality_score').sort_values('business_name')),
+    'smart_filter': (smart_filter_rows, None),
+    'remove_non_businesses': (remove_non_businesses_rows, _dedup_and_sort('remove_non_businesses')),
+    'recategorize_other': (recategorize_other_rows, lambda df: df.head(TOP_BUSINESSES)),
+}
+
+
+# Rules each cleaner's output depends on besides its input. Together with the
+# cleaner's own code they make up its fingerprint, so editing a keyword list
+# changes only the fingerprints of the cleaners that use it.
+#
+# The rows functions call into helpers here and in the modules below, so
+# their source is part of every fingerprint too - an edit anywhere in the
+# engine makes every cleaner run again.
+ENGINE_MODULES = [__name__, 'parsing', 'address_parser', 'phone_index', 'junk_filter',
+                  'name_tokens', 'keyword_categorizer', 'category_rules']
+CLEANER_RULES = {
+    'clean_data': [ADDRESS_START, POSTAL_CODE],
+    'deep_clean': [JUNK_RULES['deep_clean'], scanner(STREET_ADDRESS), DEEP_CLEAN_LABELS],
+    'ultra_clean': [ULTRA_CLEAN_POSTAL],
+    'final_deep_clean': [POSTAL_CODE, scanner(ADDRESS_START), TRAILING_PROVINCE, FSA_PROVINCE, FSA_OVERRIDES,
+                         CATEGORY_RULES['final_deep_clean']],
+    'use_full_database': [POSTAL_CODE, CATEGORY_RULES['use_full_database'], FILTER_RULES['use_full_database']],
+    'process_full_database_clean': [JUNK_RULES['process_full_database_clean'], LEADING_JUNK, ODD_CHARACTERS,
+                                    CATEGORY_RULES['process_full_database_clean']],
+    'final_cleanup': [JUNK_RULES['final_cleanup'], CATEGORY_RULES['final_cleanup']],
+    'find_best_200': [PROFESSIONAL_WORDS, SHOWCASE_SIZE],
+    'smart_filter': [FILTER_RULES['smart_filter'], CATEGORY_RULES['smart_filter']],
+    'remove_non_businesses': [FILTER_RULES['remove_non_businesses'], CATEGORY_RULES['remove_non_businesses']],
+    'recategorize_other': [CATEGORY_RULES['recategorize_other'], TOP_BUSINESSES],
+}
+
+
+def _plain(rule):
+    """A stable text form of a rule - patterns by source and flags, functions by source code"""
+    if isinstance(rule, re.Pattern):
+        return f"re({rule.pattern!r}, {int(rule.flags)})"
+    if callable(rule):
+        return inspect.getsource(rule)
+    if isinstance(rule, dict):
+        return '{' + ', '.join(f"{key!r}: {_plain(value)}" for key, value in rule.items()) + '}'
+    if isinstance(rule, (list, tuple)):
+        return '[' + ', '.join(_plain(item) for item in rule) + ']'
+    return repr(rule)
+
+
+@lru_cache(maxsize=None)
+def engine_source():
+    """Source of every engine module, in ENGINE_MODULES order"""
+    return ''.join(inspect.getsource(sys.modules[module]) for module in ENGINE_MODULES)
+
+
+@lru_cache(maxsize=None)
+def rules_fingerprint(name):
+    """Hash of a cleaner's code and rules - changes whenever either, or the engine, does"""
+    rows, final = CLEANERS[name]
+    parts = [rows, final, DEDUP_KEYS.get(name), SORT_KEYS.get(name), PHONE_TEXT] if final else [rows]
+    return hashlib.sha256((engine_source() + _plain(parts + CLEANER_RULES[name])).encode()).hexdigest()
+
+
+def finish(name, rows):
+    """Apply a cleaner's whole-frame steps (dedup, sort) to its row-local output"""
+    _, final = CLEANERS[name]
+    return final(rows) if final else rows
+
+
+def rule_filters(name):
+    """The junk and non-business filters a cleaner counts rule hits in"""
+    return [filters[name] for filters in (JUNK_FILTERS, FILTERS) if name in filters]
+
+
+# Cleaners whose rows() numbers its output from 0 rather than keeping the
+# input's labels, like the scripts' DataFrame(list) did - and how many numbers
+# one call uses up, given its input and output. A sharded run shifts each
+# shard's numbers past the earlier shards', so the index is the serial one.
+SHARD_NUMBERING = {
+    'clean_data': lambda shard, out: len(shard),     # by input position
+    'ultra_clean': lambda shard, out: len(shard),
+    'deep_clean': lambda shard, out: len(out),       # renumbered output
+    'final_deep_clean': lambda shard, out: len(out),
+    'process_full_database_clean': lambda shard, out: len(out),
+    'final_cleanup': lambda shard, out: len(out),
+    # Numbered before the non-business filter drops rows
+    'use_full_database': lambda shard, out: int(_use_full_database_names(shard)[1].sum()),
+}
+
+
+def _shard_rows(name, shard):
+    """Pool worker: a cleaner's row-local output for one shard, the index numbers it
+    used (None if it keeps the input's labels) and the rule hits it caused"""
+    rows, _ = CLEANERS[name]
+    before = [rule_filter.hits.copy() for rule_filter in rule_filters(name)]
+    out = rows(shard)
+    numbered = SHARD_NUMBERING[name](shard, out) if name in SHARD_NUMBERING else None
+    return out, numbered, [rule_filter.hits - hits for rule_filter, hits in zip(rule_filters(name), before)]
+
+
+def parallel_rows(name, df, workers):
+    """A cleaner's row-local part over contiguous shards in a process pool
+
+    Shards come back in input order and are concatenated, so the rows and
+    index are the ones a single rows() call gives, in the same order; the
+    rule hits the workers counted are added to this process's filters. Small
+    frames just run here.
+    """
+    rows, _ = CLEANERS[name]
+    shards = min(workers, len(df) // MIN_SHARD_ROWS)
+    if shards <= 1:
+        return rows(df)
+    bounds = np.linspace(0, len(df), shards + 1).astype(int)
+    parts = [df.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+    with ProcessPoolExecutor(max_workers=shards) as pool:
+        results = list(pool.map(_shard_rows, [name] * shards, parts))
+    outs = []
+    offset = 0
+    for out, numbered, hits in results:
+        for rule_filter, shard_hits in zip(rule_filters(name), hits):
+            rule_filter.hits.update(shard_hits)
+        if numbered is not None:
+            out = out.set_axis(out.index + offset)
+            offset += numbered
+        outs.append(out)
+    return pd.concat(outs)
+
+
+def clean(name, df, workers=1):
+    """Run one cleaner end to end - same frame the script's loop plus its dedup/sort produced
+
+    With workers > 1 the row-local part runs sharded across processes; the
+    dedup and sort still see the whole merged frame, so the output matches
+    the serial run row for row.
+    """
+    rows, _ = CLEANERS[name]
+    return finish(name, parallel_rows(name, df, workers) if workers > 1 else rows(df))
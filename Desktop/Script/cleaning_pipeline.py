@@ -0,0 +1,211 @@
+import argparse
+import glob
+import hashlib
+import os
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from cleaning_engine import clean, rules_fingerprint
+
+# The whole chain of cleaning scripts as one in-process run. Each stage is one
+# script's cleaner; DataFrames go straight from stage to stage instead of
+# through an Excel file per script, and one workbook with a sheet per stage is
+# written at the end.
+#
+#   raw ─┬─ clean_data
+#        └─ deep_clean ─┬─ find_best_200 ─ final_deep_clean ─ ultra_clean ─┬─ smart_filter
+#                       │                                                  └─ remove_non_businesses
+#                       └─ use_full_database ─┬─ recategorize_other ─ final_cleanup
+#                                             └─ process_full_database_clean
+#
+# Every hand-off goes through excel_round_trip() so each stage sees exactly what
+# its script would have read back from the previous script's workbook.
+#
+# Stage outputs are cached by content: a stage's key is a hash of the frame it
+# reads plus its cleaner's code and rules. Change a category keyword and only
+# the stages using it (and whatever their new output feeds) run again - the
+# rest, deep_clean included, come straight from the cache.
+
+RAW_FILE = '/Users/Jon/Desktop/Indigenous_Businesses_20250616_1449.xlsx'
+OUTPUT_FILE = '/Users/Jon/Desktop/INDIGENOUS_BUSINESSES_PIPELINE.xlsx'
+CACHE_DIR = '/Users/Jon/Desktop/.cleaning_cache'
+
+# name: stage name (also the cleaner it runs), source: stage it reads, sheet: its sheet in the output
+Stage = namedtuple('Stage', ['name', 'source', 'sheet'])
+
+STAGES = [
+    Stage('clean_data', 'raw', 'Clean Data'),
+    Stage('deep_clean', 'raw', 'Final Clean'),
+    Stage('find_best_200', 'deep_clean', 'Top 200 Showcase'),
+    Stage('final_deep_clean', 'find_best_200', 'Government Ready'),
+    Stage('ultra_clean', 'final_deep_clean', 'Final Government'),
+    Stage('smart_filter', 'ultra_clean', 'Smart Filtered'),
+    Stage('remove_non_businesses', 'ultra_clean', 'Commercial Businesses'),
+    Stage('use_full_database', 'deep_clean', 'Full Database'),
+    Stage('recategorize_other', 'use_full_database', 'Top 1000 Categorized'),
+    Stage('final_cleanup', 'recategorize_other', 'Ultra Clean'),
+    Stage('process_full_database_clean', 'use_full_database', 'Verified'),
+]
+STAGE_NAMES = [stage.name for stage in STAGES]
+
+# Strings pd.read_excel() turns into NaN by default
+EXCEL_NA_VALUES = {
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+}
+
+
+def excel_round_trip(df):
+    """The frame as pd.read_excel() would give it back after to_excel(index=False)
+
+    Fresh index, NA-looking strings as NaN, repeated headers renamed "X.1" and
+    text columns back to plain object dtype.
+    """
+    df = df.reset_index(drop=True)
+    seen = {}
+    columns = []
+    for column in df.columns:
+        count = seen.get(column, 0)
+        seen[column] = count + 1
+        columns.append(f"{column}.{count}" if count else column)
+    df.columns = columns
+    for column in df.columns:
+        values = df[column]
+        if values.dtype == object or pd.api.types.is_string_dtype(values):
+            values = values.astype(object)
+            df[column] = values.where(~values.isin(EXCEL_NA_VALUES), np.nan)
+    return df
+
+
+def required(targets):
+    """Stage names needed to build the targets (all stages if none), in run order"""
+    if not targets:
+        return list(STAGE_NAMES)
+    sources = {stage.name: stage.source for stage in STAGES}
+    needed = set()
+    for name in targets:
+        while name in sources and name not in needed:
+            needed.add(name)
+            name = sources[name]
+    return [name for name in STAGE_NAMES if name in needed]
+
+
+def frame_fingerprint(df):
+    """Hash of a frame's columns, dtypes, index and values"""
+    digest = hashlib.sha256()
+    digest.update(repr([(str(column), str(dtype)) for column, dtype in df.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def stage_key(name, source):
+    """Cache key for running a stage on this input"""
+    return hashlib.sha256(f"{name}:{rules_fingerprint(name)}:{frame_fingerprint(source)}".encode()).hexdigest()[:20]
+
+
+def cache_path(cache_dir, name, key):
+    return os.path.join(cache_dir, f"{name}-{key}.pkl")
+
+
+def load_cached(cache_dir, name, key):
+    """A stage's cached output, or None - an entry that won't unpickle is a miss"""
+    path = cache_path(cache_dir, name, key)
+    if not os.path.exists(path):
+        return None
+    try:
+        return pd.read_pickle(path)
+    except Exception:
+        return None
+
+
+def save_cached(cache_dir, name, key, frame):
+    """Store a stage's output, then drop that stage's older entries"""
+    path = cache_path(cache_dir, name, key)
+    # Write then rename, so an interrupted run never leaves half a pickle under a real key
+    frame.to_pickle(path + '.tmp')
+    os.replace(path + '.tmp', path)
+    for old in glob.glob(cache_path(cache_dir, name, '*')):
+        if old != path:
+            os.remove(old)
+
+
+def run_pipeline(raw, targets=None, cache_dir=None, workers=1):
+    """Run the stages (with their upstream stages) on a raw extraction frame
+
+    Returns {stage name: output frame}. With a cache_dir, a stage whose input
+    and rules match a cached run is loaded from there instead of rerun. With
+    workers > 1 big stages are cleaned in parallel - same output either way.
+    """
+    frames = {'raw': raw}
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    sources = {stage.name: stage.source for stage in STAGES}
+    for name in required(targets):
+        started = time.time()
+        source = frames[sources[name]]
+        if sources[name] != 'raw':
+            source = excel_round_trip(source)
+
+        key = stage_key(name, source) if cache_dir else None
+        cached = load_cached(cache_dir, name, key) if key else None
+        if cached is not None:
+            frames[name] = cached
+            print(f"⏩ {name:<28} {len(frames[name]):>8,} rows (cached)")
+            continue
+
+        frames[name] = clean(name, source, workers)
+        if key:
+            save_cached(cache_dir, name, key, frames[name])
+        print(f"✅ {name:<28} {len(frames[name]):>8,} rows ({time.time() - started:.1f}s)")
+
+    del frames['raw']
+    return frames
+
+
+def read_raw(path):
+    """The extraction output - the extractor's Excel file or its master CSV"""
+    if path.lower().endswith('.csv'):
+        return pd.read_csv(path)
+    return pd.read_excel(path)
+
+
+def write_workbook(frames, output):
+    """One sheet per stage, in pipeline order"""
+    sheets = {stage.name: stage.sheet for stage in STAGES}
+    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        for name in STAGE_NAMES:
+            if name in frames:
+                frames[name].to_excel(writer, sheet_name=sheets[name], index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the whole cleaning chain in memory, raw extraction to final sheets")
+    parser.add_argument('--raw', default=RAW_FILE, help="extraction output (.xlsx or .csv)")
+    parser.add_argument('--output', default=OUTPUT_FILE, help="workbook to write, one sheet per stage")
+    parser.add_argument('--stages', nargs='+', choices=STAGE_NAMES, metavar='STAGE',
+                        help="only build these stages (and what they need): " + ', '.join(STAGE_NAMES))
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help="where stage outputs are cached")
+    parser.add_argument('--no-cache', action='store_true', help="rerun every stage and don't touch the cache")
+    parser.add_argument('--workers', type=int, help="processes for the big stages (default: all cores, 1 = serial)")
+    args = parser.parse_args()
+    workers = args.workers or os.cpu_count()
+
+    print("🚀 CLEANING PIPELINE")
+    print("=" * 60)
+    raw = read_raw(args.raw)
+    print(f"📥 {len(raw):,} raw rows from {args.raw}\n")
+
+    started = time.time()
+    frames = run_pipeline(raw, args.stages, None if args.no_cache else args.cache_dir, workers)
+    write_workbook(frames, args.output)
+
+    print(f"\n⏱️  {len(frames)} stages in {time.time() - started:.1f}s")
+    print(f"💾 Saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
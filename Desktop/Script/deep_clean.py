@@ -1,5 +1,7 @@
 import pandas as pd
-import re
+
+from junk_filter import JUNK_FILTERS
+from cleaning_engine import deep_clean_rows, finish
 
 # Load the original data
 df = pd.read_excel("/Users/Jon/Desktop/Indigenous_Businesses_20250616_1449.xlsx")
@@ -8,86 +10,11 @@ print(f"Starting with {len(df)} raw entries...")
 # First, let's see what we're dealing with
 print("\n🔍 ANALYZING DATA QUALITY...")
 
-clean_businesses = []
-
-for _, row in df.iterrows():
-    full_text = str(row['name']).strip()
-    phone = str(row['phone']).strip()
-    
-    # Skip obvious junk entries
-    junk_patterns = [
-        r'^(phone|fax|tel|fox|tél|téléc|suite|tel\.|fax\.|fox\.)[\s:]*$',
-        r'^[A-Z]{2,}[\s]*$',  # Just caps like "COMMUNICATION"
-        r'^\W+$',  # Just symbols
-        r'^[\d\s\-\(\)]+$',  # Just numbers
-        r'^\.+$',  # Just dots
-        r'^\s*$'  # Empty
-    ]
-    
-    if any(re.match(pattern, full_text, re.I) for pattern in junk_patterns):
-        continue
-    
-    # Skip if too short
-    if len(full_text) < 5:
-        continue
-    
-    # Skip if it's clearly a fragment
-    if full_text.startswith('\\') or full_text.startswith("'") or full_text.endswith("_"):
-        full_text = full_text.strip("\\'_")
-    
-    # Extract postal code first
-    postal_match = re.search(r'[A-Z]\d[A-Z]\s*\d[A-Z]\d', full_text)
-    postal_code = postal_match.group(0) if postal_match else ""
-    
-    # Look for address patterns
-    address_patterns = r'(\d+[\s,]+(?:rue|boul|avenue|road|drive|street|chemin)|P\.?O\.?\s*Box|General Delivery|Suite\s+\d+)'
-    address_match = re.search(address_patterns, full_text, re.I)
-    
-    if address_match:
-        # Everything before the address is the business name
-        business_name = full_text[:address_match.start()].strip(' ,.-_')
-        address = full_text[address_match.start():].strip()
-    else:
-        # Check if there's a comma that might separate name from location
-        if ',' in full_text:
-            parts = full_text.split(',', 1)
-            business_name = parts[0].strip()
-            address = parts[1].strip() if len(parts) > 1 else ""
-        else:
-            business_name = full_text
-            address = ""
-    
-    # Clean up business name
-    business_name = re.sub(r'[\s,\._-]+$', '', business_name).strip()
-    
-    # Final quality checks
-    if len(business_name) < 3:
-        continue
-    
-    # Skip if business name is just numbers or single words that look like labels
-    if business_name.lower() in ['suite', 'phone', 'fax', 'tel', 'general', 'delivery']:
-        continue
-    
-    # Skip if it contains obvious OCR errors
-    if '__' in business_name or business_name.count('(') != business_name.count(')'):
-        continue
-    
-    clean_businesses.append({
-        'business_name': business_name,
-        'address': address,
-        'postal_code': postal_code,
-        'phone': phone,
-        'source': row['folder']
-    })
-
-# Create clean dataframe
-clean_df = pd.DataFrame(clean_businesses)
-
-# Remove duplicates based on name AND phone
-clean_df = clean_df.drop_duplicates(subset=['business_name', 'phone'])
+# Skip junk entries, split names from addresses, pull postal codes (cleaning_engine.py)
+clean_businesses = deep_clean_rows(df)
 
-# Sort by business name
-clean_df = clean_df.sort_values('business_name')
+# Remove duplicates based on name AND phone, then sort by business name
+clean_df = finish('deep_clean', clean_businesses)
 
 # Save the REALLY clean version
 output = "/Users/Jon/Desktop/Indigenous_Businesses_FINAL_CLEAN.xlsx"
@@ -130,6 +57,7 @@ print(f"📊 Started with: {len(df):,} raw entries")
 print(f"🧹 Cleaned to: {len(clean_df):,} real businesses")
 print(f"📍 With addresses: {clean_df['address'].str.len().gt(5).sum():,}")
 print(f"📮 With postal codes: {clean_df['postal_code'].notna().sum():,}")
+JUNK_FILTERS['deep_clean'].report("\n🗑️  Junk rejected by rule:")
 print(f"\n💾 Saved to: {output}")
 
 print("\n📋 Sample of CLEAN businesses:")
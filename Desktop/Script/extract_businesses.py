@@ -1,63 +1,401 @@
-import pytesseract
 from PIL import Image
 import pandas as pd
 import re
 import os
+import time
+import io
+import argparse
+from functools import partial
+from collections import namedtuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
-print("🚀 INDIGENOUS BUSINESS EXTRACTOR STARTING...")
-print("=" * 60)
+from ocr_cache import OCRCache, DEFAULT_CACHE_PATH, cache_key, image_hash
+from extraction_manifest import ExtractionManifest, DEFAULT_MANIFEST_PATH
+from layout_ocr import parse_layout, page_confidence
+from preprocess import PREPROCESS_CONFIG, preprocessed_png, tesseract_config, config_hash
+from page_regions import FOLDER_REGIONS, crop_to_region, region_tag
+from ocr_backends import BACKENDS, backend_tag, get_backend
+from parsing import PHONE
 
 # Your folders
 base = "/Users/Jon/Desktop/indiana communication "
 folder1 = os.path.join(base, "Data 1")
 folder2 = os.path.join(base, "Data2")
+FOLDERS = [(folder1, "Data 1"), (folder2, "Data2")]
 
-all_businesses = []
-total_processed = 0
-
-# Process both folders
-for folder_path, folder_name in [(folder1, "Data 1"), (folder2, "Data2")]:
-    files = [f for f in os.listdir(folder_path) if f.lower().endswith('.png')]
-    print(f"\n📁 Processing {len(files)} files from {folder_name}...")
-    
-    for i, png_file in enumerate(files):
-        if i % 25 == 0:
-            print(f"   Progress: {i}/{len(files)} files...")
-        
+PHONE_PATTERN = re.compile(r'([^\n]+?)\s*' + PHONE.pattern)
+
+# What one OCR'd page hands back; error is None unless the page failed, confidence is
+# the mean word confidence (layout engine only) and retried says the slow pass won.
+# retry_error is set when the slow pass failed - the page keeps its first-pass rows
+PageResult = namedtuple('PageResult', ['path', 'folder', 'rows', 'pid', 'seconds', 'cached', 'error',
+                                       'confidence', 'retried', 'retry_error'])
+
+# Second pass for low-confidence pages: no downscaling plus binarize/deskew, and
+# tesseract told to expect a single column of text of variable sizes
+RETRY_PSM = 4
+RETRY_PREPROCESS = dict(PREPROCESS_CONFIG, target_dpi=None)
+
+
+def list_png_files(folders=FOLDERS):
+    """All PNGs to OCR as (path, folder_name), in the same order as the serial run"""
+    tasks = []
+    for folder_path, folder_name in folders:
+        files = [f for f in os.listdir(folder_path) if f.lower().endswith('.png')]
+        tasks.extend((os.path.join(folder_path, f), folder_name) for f in files)
+    return tasks
+
+
+def parse_businesses(text, folder_name):
+    """Pull (name, phone, folder) rows out of the OCR text of one page"""
+    businesses = []
+    for match in PHONE_PATTERN.findall(text):
+        line = match[0].strip()
+        phone = f"({match[1]}) {match[2]}-{match[3]}"
+
+        if line and len(line) > 3:
+            businesses.append({
+                'name': line,
+                'phone': phone,
+                'folder': folder_name
+            })
+    return businesses
+
+
+_caches = {}
+
+
+def _get_cache(cache_path):
+    """One cache connection per process (pool workers can't share sqlite handles)"""
+    if cache_path not in _caches:
+        _caches[cache_path] = OCRCache(cache_path)
+    return _caches[cache_path]
+
+
+def _run_tesseract(data, img_hash, variant, preprocess=None, region=None, backend='subprocess', psm=None):
+    config = ''
+    if preprocess is not None:
+        img = Image.open(io.BytesIO(preprocessed_png(data, img_hash, preprocess, region=region)))
+        config = tesseract_config(img)
+    else:
+        img = crop_to_region(Image.open(io.BytesIO(data)), region)
+    if psm is not None:
+        config = f"{config} --psm {psm}".strip()
+    ocr = get_backend(backend)
+    if variant == 'tsv':
+        return ocr.image_to_data(img, config=config)
+    return ocr.image_to_string(img, config=config)
+
+
+def ocr_text(data, cache_path=DEFAULT_CACHE_PATH, variant='text', preprocess=None, region=None,
+             backend='subprocess', psm=None):
+    """OCR output for raw PNG bytes - served from the cache when this exact image was seen before
+
+    variant 'text' is the flat page text, 'tsv' is tesseract's word-level TSV with bounding boxes.
+    preprocess is a preprocess.py config dict, or None to OCR the screenshot as-is.
+    region is a page_regions.FOLDER_REGIONS spec, or None for the whole page.
+    backend picks how tesseract runs (see ocr_backends.py) - each keeps its own cache
+    entries, they can link different tesseract builds. psm overrides tesseract's page
+    segmentation mode.
+    """
+    img_hash = image_hash(data)
+    if cache_path is None:
+        return _run_tesseract(data, img_hash, variant, preprocess, region, backend, psm), False
+
+    # Same screenshot, different pixels going into tesseract - keep the results apart
+    variant_key = variant
+    if preprocess is not None:
+        variant_key += f"+pre:{config_hash(preprocess)}"
+    if region is not None:
+        variant_key += f"+roi:{region_tag(region)}"
+    if psm is not None:
+        variant_key += f"+psm:{psm}"
+    if backend_tag(backend):
+        variant_key += f"+{backend_tag(backend)}"
+    cache = _get_cache(cache_path)
+    key = cache_key(img_hash, variant=variant_key)
+    text = cache.get(key)
+    if text is not None:
+        return text, True
+
+    text = _run_tesseract(data, img_hash, variant, preprocess, region, backend, psm)
+    cache.put(key, img_hash, text, variant=variant_key)
+    return text, False
+
+
+ENGINES = {
+    # engine name -> (tesseract output variant, page parser)
+    'text': ('text', parse_businesses),
+    'layout': ('tsv', parse_layout),
+}
+
+
+def ocr_page(task, cache_path=DEFAULT_CACHE_PATH, engine='text', preprocess=None, crop=False,
+             backend='subprocess', reocr_below=None):
+    """OCR one PNG into a PageResult - failures are reported, not swallowed
+
+    With reocr_below set (layout engine), a page whose mean word confidence is
+    under it gets a second, slower pass (RETRY_PSM / RETRY_PREPROCESS) and we keep
+    whichever pass tesseract was more confident about.
+    """
+    png_path, folder_name = task
+    variant, parse = ENGINES[engine]
+    start = time.perf_counter()
+    cached = False
+    error = None
+    confidence = None
+    retried = False
+    retry_error = None
+    try:
+        with open(png_path, 'rb') as f:
+            data = f.read()
+        region = FOLDER_REGIONS.get(folder_name) if crop else None
+        text, cached = ocr_text(data, cache_path, variant, preprocess, region, backend)
+        rows = parse(text, folder_name)
+        if variant == 'tsv':
+            confidence = page_confidence(text)
+    except Exception as e:
+        rows = []
+        error = f"{type(e).__name__}: {e}"
+
+    # Its own try - a failed second pass must not cost the page its first one
+    if error is None and reocr_below is not None and confidence is not None and confidence < reocr_below:
         try:
-            img = Image.open(os.path.join(folder_path, png_file))
-            text = pytesseract.image_to_string(img, lang='fra+eng')
-            
-            # Find phone numbers
-            phones = re.findall(r'([^\n]+?)\s*\((\d{3})\)\s*(\d{3})-(\d{4})', text)
-            
-            for match in phones:
-                line = match[0].strip()
-                phone = f"({match[1]}) {match[2]}-{match[3]}"
-                
-                if line and len(line) > 3:
-                    all_businesses.append({
-                        'name': line,
-                        'phone': phone,
-                        'folder': folder_name
-                    })
-        except:
-            pass
-        
-        total_processed += 1
-
-# Save results
-df = pd.DataFrame(all_businesses)
-df = df.drop_duplicates(subset=['name', 'phone'])
-
-timestamp = datetime.now().strftime("%Y%m%d_%H%M")
-output = f"/Users/Jon/Desktop/Indigenous_Businesses_{timestamp}.xlsx"
-df.to_excel(output, index=False)
-
-print(f"\n✅ EXTRACTION COMPLETE!")
-print(f"📊 Processed: {total_processed} PNG files")
-print(f"🏢 Found: {len(all_businesses)} total entries")
-print(f"✨ Unique: {len(df)} businesses (after removing duplicates)")
-print(f"💾 Saved to: {output}")
-print(f"\n🎉 Check your Desktop for the Excel file!")
+            retry_text, retry_cached = ocr_text(data, cache_path, variant, RETRY_PREPROCESS, region, backend,
+                                                psm=RETRY_PSM)
+            retry_confidence = page_confidence(retry_text)
+            if retry_confidence > confidence:
+                rows = parse(retry_text, folder_name)
+                confidence = retry_confidence
+                retried = True
+            cached = cached and retry_cached
+        except Exception as e:
+            retry_error = f"{type(e).__name__}: {e}"
+            cached = False
+    return PageResult(png_path, folder_name, rows, os.getpid(), time.perf_counter() - start, cached, error,
+                      confidence, retried, retry_error)
+
+
+def _init_worker():
+    # Tesseract spins up its own OpenMP threads - with one process per core that
+    # just oversubscribes the box, so each worker gets a single thread
+    os.environ['OMP_THREAD_LIMIT'] = '1'
+
+
+def ocr_pages(tasks, workers=1, cache_path=DEFAULT_CACHE_PATH, engine='text', preprocess=None, crop=False,
+              backend='subprocess', reocr_below=None):
+    """Yield a PageResult per task, in task order, fanned out over `workers` processes
+
+    Only a few pages per worker are in flight at once, so memory stays flat no
+    matter how many tasks are queued and a slow consumer throttles the pool.
+    """
+    work = partial(ocr_page, cache_path=cache_path, engine=engine, preprocess=preprocess, crop=crop,
+                   backend=backend, reocr_below=reocr_below)
+    if workers <= 1:
+        yield from map(work, tasks)
+        return
+
+    window = workers * 4
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(work, task))
+            if len(pending) >= window:
+                # Oldest first, so the output matches the serial run
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _report_error(result):
+    print(f"   ⚠️  {os.path.basename(result.path)}: {result.error}")
+
+
+def iter_businesses(folders=FOLDERS, workers=1, engine='text', preprocess=None, crop=False,
+                    cache_path=DEFAULT_CACHE_PATH, backend='subprocess', reocr_below=None,
+                    on_error=_report_error):
+    """Yield business records as each page finishes - import this instead of running the script
+
+        from extract_businesses import iter_businesses
+        for record in iter_businesses(workers=8, engine='layout'):
+            ...
+
+    Records come out in the same order as a full run ('name', 'phone', 'folder',
+    plus the structured fields and word confidences for the layout engine).
+    Failed pages go to on_error.
+    """
+    tasks = list_png_files(folders)
+    for result in ocr_pages(tasks, workers, cache_path, engine, preprocess, crop, backend, reocr_below):
+        if result.error and on_error:
+            on_error(result)
+        yield from result.rows
+
+
+def manifest_engine_label(engine, preprocess=None, crop=False, reocr_below=None):
+    """How the manifest tells extraction setups apart - preprocessed, cropped or retried pages OCR differently"""
+    label = f"{engine}+pre:{config_hash(preprocess)}" if preprocess else engine
+    if crop:
+        label += '+roi:' + ','.join(f"{name}={region_tag(FOLDER_REGIONS.get(name))}" for _, name in FOLDERS)
+    if reocr_below is not None:
+        label += f"+reocr:{reocr_below:g}"
+    return label
+
+
+def print_worker_stats(worker_stats, wall_seconds):
+    """Pages/sec per worker so we can size the pool (cache hits don't count as OCR work)"""
+    print(f"\n⚙️  WORKER THROUGHPUT:")
+    if not worker_stats:
+        print("   every page came from the OCR cache")
+    for pid, (pages, busy) in sorted(worker_stats.items()):
+        rate = pages / busy if busy else 0
+        print(f"   worker {pid}: {pages} pages in {busy:.1f}s busy = {rate:.2f} pages/sec")
+    total_pages = sum(pages for pages, _ in worker_stats.values())
+    if wall_seconds:
+        print(f"   overall: {total_pages / wall_seconds:.2f} pages/sec wall clock")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR the directory screenshots into an Excel file")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="OCR processes to run (1 = serial, 0 = one per CPU core)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="always re-OCR, ignoring the on-disk OCR cache")
+    parser.add_argument('--cache-path', default=DEFAULT_CACHE_PATH)
+    parser.add_argument('--engine', choices=sorted(ENGINES), default='text',
+                        help="'text' regexes the flat page text, 'layout' parses word boxes column by column")
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='subprocess',
+                        help="'persistent' keeps tesseract loaded in each worker (needs tesserocr)")
+    parser.add_argument('--preprocess', action='store_true',
+                        help="grayscale, downscale, binarize and deskew each page before OCR")
+    parser.add_argument('--crop', action='store_true',
+                        help="OCR only the listing area of each page (see FOLDER_REGIONS in page_regions.py)")
+    parser.add_argument('--reocr-below', type=float, default=None, metavar='CONF',
+                        help="layout engine: re-OCR pages whose mean word confidence is under CONF (0-100) "
+                             "with a slower second pass")
+    parser.add_argument('--incremental', action='store_true',
+                        help="only OCR new/modified PNGs, saving every page to the manifest as it finishes")
+    parser.add_argument('--manifest-path', default=DEFAULT_MANIFEST_PATH)
+    args = parser.parse_args()
+    if args.reocr_below is not None and args.engine != 'layout':
+        parser.error("--reocr-below needs --engine layout (only word boxes carry confidences)")
+    workers = args.workers or os.cpu_count()
+    cache_path = None if args.no_cache else args.cache_path
+    preprocess = PREPROCESS_CONFIG if args.preprocess else None
+
+    print("🚀 INDIGENOUS BUSINESS EXTRACTOR STARTING...")
+    print("=" * 60)
+
+    all_tasks = list_png_files()
+    engine_label = manifest_engine_label(args.engine, preprocess, args.crop, args.reocr_below)
+    manifest = ExtractionManifest(args.manifest_path, engine=engine_label) if args.incremental else None
+    tasks = manifest.pending(all_tasks) if manifest else all_tasks
+    if manifest:
+        print(f"📒 Manifest: {len(all_tasks) - len(tasks)} files unchanged, {len(tasks)} new or modified")
+    folder_sizes = {name: sum(1 for _, f in tasks if f == name) for _, name in FOLDERS}
+    print(f"⚡ Using {workers} OCR worker(s) for {len(tasks)} PNG files ({args.engine} engine)")
+
+    # Dedupe as pages stream in - only unique rows are ever held in memory
+    unique_businesses = []
+    seen = set()
+    total_entries = 0
+
+    def add_unique(rows):
+        nonlocal total_entries
+        total_entries += len(rows)
+        for row in rows:
+            key = (row['name'], row['phone'])
+            if key not in seen:
+                seen.add(key)
+                unique_businesses.append(row)
+
+    total_processed = 0
+    cache_hits = 0
+    low_confidence = 0
+    retried = 0
+    retry_errors = 0
+    errors = []
+    worker_stats = {}
+    start = time.perf_counter()
+
+    current_folder = None
+    i = 0
+    try:
+        for result in ocr_pages(tasks, workers, cache_path, args.engine, preprocess, args.crop, args.backend,
+                                args.reocr_below):
+            if result.folder != current_folder:
+                current_folder = result.folder
+                i = 0
+                print(f"\n📁 Processing {folder_sizes[result.folder]} files from {result.folder}...")
+            if i % 25 == 0:
+                print(f"   Progress: {i}/{folder_sizes[result.folder]} files...")
+            i += 1
+
+            if result.error:
+                errors.append(result)
+                _report_error(result)
+            if result.retry_error:
+                retry_errors += 1
+                print(f"   ⚠️  {os.path.basename(result.path)}: second pass failed, kept the first - {result.retry_error}")
+            if manifest:
+                manifest.record(result.path, result.folder, result.rows, result.error)
+            else:
+                add_unique(result.rows)
+            total_processed += 1
+            if result.confidence is not None and args.reocr_below is not None:
+                low_confidence += result.retried or result.confidence < args.reocr_below
+                retried += result.retried
+            if result.cached:
+                cache_hits += 1
+                continue
+            pages, busy = worker_stats.get(result.pid, (0, 0.0))
+            worker_stats[result.pid] = (pages + 1, busy + result.seconds)
+    except KeyboardInterrupt:
+        if not manifest:
+            raise
+        print(f"\n⏸️  Interrupted after {total_processed} files - they're saved in the manifest, rerun with --incremental to resume")
+        return
+
+    wall_seconds = time.perf_counter() - start
+
+    # Save results
+    if manifest:
+        # Everything extracted so far, this run and earlier ones, in full-run order
+        all_rows = manifest.to_dataframe(all_tasks)
+        task_paths = {png_path for png_path, _ in all_tasks}
+        failures = [(path, error) for path, error in manifest.failures() if path in task_paths]
+        manifest.close()
+        total_entries = len(all_rows)
+        df = all_rows.drop_duplicates(subset=['name', 'phone'])
+    else:
+        failures = []
+        df = pd.DataFrame(unique_businesses) if unique_businesses else pd.DataFrame(columns=['name', 'phone', 'folder'])
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+    output = f"/Users/Jon/Desktop/Indigenous_Businesses_{timestamp}.xlsx"
+    df.to_excel(output, index=False)
+
+    print(f"\n✅ EXTRACTION COMPLETE!")
+    print(f"📊 Processed: {total_processed} PNG files")
+    print(f"🏢 Found: {total_entries} total entries")
+    print(f"✨ Unique: {len(df)} businesses (after removing duplicates)")
+    print(f"📦 OCR cache: {cache_hits} hits, {total_processed - cache_hits} pages OCR'd")
+    if args.reocr_below is not None:
+        print(f"🔁 Low-confidence pages: {low_confidence}, {retried} improved by the second pass")
+        if retry_errors:
+            print(f"⚠️  {retry_errors} second passes failed - those pages kept their first-pass rows")
+    if errors:
+        print(f"⚠️  {len(errors)} files failed - see messages above")
+    if failures:
+        # Still failing in the manifest, from this run or an earlier one - the next --incremental retries them
+        print(f"📒 {len(failures)} files in the manifest without rows:")
+        for path, error in failures:
+            print(f"   {path}: {error}")
+    print_worker_stats(worker_stats, wall_seconds)
+    print(f"💾 Saved to: {output}")
+    print(f"\n🎉 Check your Desktop for the Excel file!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import sqlite3
+import os
+import time
+import json
+
+import pandas as pd
+
+DEFAULT_MANIFEST_PATH = "/Users/Jon/Desktop/indiana communication /extraction_manifest.sqlite"
+
+
+class ExtractionManifest:
+    """Durable record of which PNGs were extracted, plus the rows each one produced.
+
+    Every page is committed on its own, so a crash or Ctrl-C only loses the page
+    that was in flight - the next run picks up the rest.
+    """
+
+    def __init__(self, path=DEFAULT_MANIFEST_PATH, engine='text'):
+        self.path = path
+        self.engine = engine
+        self.conn = sqlite3.connect(path, timeout=60)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=FULL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                folder TEXT NOT NULL,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                row_count INTEGER NOT NULL,
+                error TEXT,
+                processed_at REAL NOT NULL,
+                engine TEXT NOT NULL DEFAULT 'text'
+            )""")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS rows (
+                path TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                phone TEXT NOT NULL,
+                folder TEXT NOT NULL,
+                extra TEXT,
+                PRIMARY KEY (path, seq)
+            )""")
+        self._migrate()
+        self.conn.commit()
+        # A page extracted by a different engine counts as not done
+        self._known = {
+            path: (mtime, size, status)
+            for path, mtime, size, status in self.conn.execute(
+                "SELECT path, mtime, size, status FROM files WHERE engine = ?", (engine,))
+        }
+
+    def _migrate(self):
+        """Bring manifests written before the layout engine up to the current schema"""
+        file_columns = {row[1] for row in self.conn.execute("PRAGMA table_info(files)")}
+        if 'engine' not in file_columns:
+            self.conn.execute("ALTER TABLE files ADD COLUMN engine TEXT NOT NULL DEFAULT 'text'")
+        row_columns = {row[1] for row in self.conn.execute("PRAGMA table_info(rows)")}
+        if 'extra' not in row_columns:
+            self.conn.execute("ALTER TABLE rows ADD COLUMN extra TEXT")
+
+    def is_current(self, path, mtime, size):
+        """True if this exact file (same mtime and size) was already extracted cleanly"""
+        return self._known.get(path) == (mtime, size, 'ok')
+
+    def pending(self, tasks):
+        """Only the (path, folder) tasks that are new, modified or failed last time"""
+        todo = []
+        for png_path, folder_name in tasks:
+            st = _stat(png_path)
+            if not self.is_current(png_path, *st):
+                todo.append((png_path, folder_name))
+        return todo
+
+    def record(self, png_path, folder_name, rows, error=None):
+        """Replace this file's rows and manifest entry in one transaction"""
+        mtime, size = _stat(png_path)
+        status = 'error' if error else 'ok'
+        with self.conn:
+            self.conn.execute("DELETE FROM rows WHERE path = ?", (png_path,))
+            self.conn.executemany(
+                "INSERT INTO rows VALUES (?, ?, ?, ?, ?, ?)",
+                [(png_path, seq, row['name'], row['phone'], row['folder'], _extra(row))
+                 for seq, row in enumerate(rows)])
+            self.conn.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (png_path, folder_name, mtime, size, status, len(rows), error, time.time(), self.engine))
+        self._known[png_path] = (mtime, size, status)
+
+    def failures(self):
+        """(path, error) for every file this engine failed on and hasn't extracted since"""
+        return self.conn.execute("SELECT path, error FROM files WHERE status = 'error' AND engine = ? ORDER BY path",
+                                 (self.engine,)).fetchall()
+
+    def to_dataframe(self, tasks):
+        """All stored rows for the given tasks, in task order - same rows a full run would produce"""
+        order = {png_path: i for i, (png_path, _) in enumerate(tasks)}
+        df = pd.read_sql_query("SELECT path, seq, name, phone, folder, extra FROM rows", self.conn)
+        df = df[df['path'].isin(order)]
+        df = df.assign(_order=df['path'].map(order)).sort_values(['_order', 'seq'])
+        records = []
+        for name, phone, folder, extra in df[['name', 'phone', 'folder', 'extra']].itertuples(index=False):
+            record = {'name': name, 'phone': phone, 'folder': folder}
+            if extra:
+                record.update(json.loads(extra))
+            records.append(record)
+        if not records:
+            return pd.DataFrame(columns=['name', 'phone', 'folder'])
+        return pd.DataFrame(records)
+
+    def close(self):
+        self.conn.close()
+
+
+def _extra(row):
+    """Anything beyond name/phone/folder (layout engine fields) rides along as JSON"""
+    extra = {k: v for k, v in row.items() if k not in ('name', 'phone', 'folder')}
+    return json.dumps(extra, ensure_ascii=False) if extra else None
+
+
+def _stat(png_path):
+    st = os.stat(png_path)
+    return st.st_mtime, st.st_size
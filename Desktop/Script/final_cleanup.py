@@ -1,5 +1,7 @@
 import pandas as pd
-import re
+
+from junk_filter import JUNK_FILTERS
+from cleaning_engine import final_cleanup_rows, finish
 
 # Load the data
 df = pd.read_excel('/Users/Jon/Desktop/INDIGENOUS_BUSINESSES_FINAL_CATEGORIZED.xlsx', sheet_name='Top 1000 Businesses')
@@ -8,76 +10,11 @@ print("🧹 FINAL AGGRESSIVE CLEANUP")
 print("=" * 60)
 print(f"Starting with: {len(df)} entries")
 
-# Filter out junk entries
-clean_businesses = []
-
-for _, row in df.iterrows():
-    name = str(row.get('Business Name', '')).strip()
-    address = str(row.get('Address', '')).strip()
-    phone = str(row.get('Phone', '')).strip()
-    
-    # SKIP if:
-    # 1. No real business name
-    if not name or name == 'nan' or name == 'Other':
-        continue
-        
-    # 2. Name is just numbers or phone number
-    if re.match(r'^[\d\s\-\(\)]+$', name):
-        continue
-        
-    # 3. Name is too short (likely junk)
-    if len(name) < 5:
-        continue
-        
-    # 4. Name is just an address
-    if any(indicator in name.lower() for indicator in ['street', 'road', 'avenue', 'main st']):
-        continue
-        
-    # 5. Name is generic location
-    if name.lower() in ['quebec', 'québec', 'kahnawake', 'wendake']:
-        continue
-        
-    # 6. Missing critical info (must have name AND phone)
-    if not phone or phone == 'nan':
-        continue
-    
-    # Proper categorization
-    name_lower = name.lower()
-    
-    # High-value categories
-    if any(word in name_lower for word in ['construction', 'builder', 'contractor', 'excavation']):
-        category = 'Construction & Infrastructure'
-    elif any(word in name_lower for word in ['transport', 'trucking', 'freight', 'moving', 'logistics']):
-        category = 'Transportation & Logistics'
-    elif any(word in name_lower for word in ['consulting', 'conseil', 'professional', 'services', 'solution']):
-        category = 'Professional Services'
-    elif any(word in name_lower for word in ['development', 'développement', 'corporation', 'enterprises']):
-        category = 'Economic Development'
-    elif any(word in name_lower for word in ['hotel', 'motel', 'inn', 'lodge', 'resort']):
-        category = 'Tourism & Hospitality'
-    elif any(word in name_lower for word in ['store', 'mart', 'market', 'dépanneur', 'boutique', 'shop']):
-        category = 'Retail'
-    elif any(word in name_lower for word in ['restaurant', 'café', 'food', 'cuisine', 'pizza']):
-        category = 'Food Services'
-    elif any(word in name_lower for word in ['fisheries', 'fishing', 'seafood']):
-        category = 'Natural Resources'
-    elif any(word in name_lower for word in ['technology', 'tech', 'computer', 'software']):
-        category = 'Technology'
-    else:
-        category = 'General Business'
-    
-    clean_businesses.append({
-        'Business Name': name,
-        'Category': category,
-        'Address': address if address != 'nan' else '',
-        'Phone': phone
-    })
-
-# Create clean dataframe
-final_df = pd.DataFrame(clean_businesses)
+# Filter out junk entries and categorize (cleaning_engine.py)
+final_df = final_cleanup_rows(df)
 
 # Remove duplicates
-final_df = final_df.drop_duplicates(subset=['Business Name', 'Phone'])
+final_df = finish('final_cleanup', final_df)
 
 print(f"\n✅ After aggressive cleanup: {len(final_df):,} REAL businesses")
 
@@ -132,6 +69,7 @@ with pd.ExcelWriter(output, engine='openpyxl') as writer:
     high_value = final_df[final_df['Category'].isin(high_value_categories)]
     high_value.to_excel(writer, sheet_name='High Value Targets', index=False)
 
+JUNK_FILTERS['final_cleanup'].report("\n🗑️  Junk rejected by rule:")
 print(f"\n📊 CATEGORY BREAKDOWN:")
 for cat, count in final_df['Category'].value_counts().head(10).items():
     print(f"   {cat}: {count:,}")
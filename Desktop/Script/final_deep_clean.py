@@ -1,5 +1,7 @@
 import pandas as pd
-import re
+
+from address_parser import print_cache_stats
+from cleaning_engine import final_deep_clean_rows, finish
 
 # Load your showcase file
 df = pd.read_excel('/Users/Jon/Desktop/Indigenous_200_SHOWCASE.xlsx', sheet_name='Top 200 Businesses')
@@ -7,74 +9,11 @@ df = pd.read_excel('/Users/Jon/Desktop/Indigenous_200_SHOWCASE.xlsx', sheet_name
 print("🧹 FINAL DEEP CLEANING FOR GOVERNMENT PRESENTATION")
 print("=" * 60)
 
-clean_data = []
-
-for _, row in df.iterrows():
-    business_name = row['business_name']
-    address = str(row['address']) if pd.notna(row['address']) else ''
-    phone = row['phone']
-    
-    # Extract postal code from address if it's there
-    postal_pattern = r'([A-Z]\d[A-Z]\s*\d[A-Z]\d)'
-    postal_match = re.search(postal_pattern, address)
-    
-    if postal_match:
-        postal_code = postal_match.group(1)
-        # Remove postal code from address
-        clean_address = address.replace(postal_code, '').strip()
-        # Also remove trailing commas, periods
-        clean_address = re.sub(r'[,.\s]+$', '', clean_address)
-    else:
-        postal_code = row['postal_code'] if pd.notna(row['postal_code']) else ''
-        clean_address = address
-    
-    # Clean up address formatting
-    clean_address = re.sub(r'\s+', ' ', clean_address)  # Multiple spaces to single
-    clean_address = clean_address.replace(' ,', ',')  # Fix space before comma
-    
-    # Skip if business name is too short or weird
-    if len(business_name) < 5 or business_name.startswith('.'):
-        continue
-        
-    clean_data.append({
-        'Business Name': business_name,
-        'Address': clean_address,
-        'Postal Code': postal_code,
-        'Phone': phone,
-        'Province': 'Quebec' if 'québec' in address.lower() or 'quebec' in address.lower() else 
-                   'New Brunswick' if 'NB' in address else
-                   'Nova Scotia' if 'NS' in address else
-                   'Ontario' if 'ON' in address else 'Unknown'
-    })
-
-# Create final dataframe
-final_df = pd.DataFrame(clean_data)
-
-# Remove any remaining duplicates
-final_df = final_df.drop_duplicates(subset=['Business Name', 'Phone'])
-
-# Sort by business name
-final_df = final_df.sort_values('Business Name')
-
-# Create categories based on business names
-def categorize_business(name):
-    name_lower = name.lower()
-    if any(word in name_lower for word in ['construction', 'builder', 'contractor']):
-        return 'Construction & Infrastructure'
-    elif any(word in name_lower for word in ['conseil', 'council', 'nation', 'première']):
-        return 'Indigenous Governance'
-    elif any(word in name_lower for word in ['centre', 'center', 'service']):
-        return 'Community Services'
-    elif any(word in name_lower for word in ['development', 'développement', 'enterprise']):
-        return 'Economic Development'
-    elif any(word in name_lower for word in ['school', 'école', 'education']):
-        return 'Education & Training'
-    elif any(word in name_lower for word in ['health', 'santé', 'clinic']):
-        return 'Healthcare'
-    else:
-        return 'Other Services'
+# Pull postal codes out of addresses, parse province and municipality, categorize (cleaning_engine.py)
+final_df = final_deep_clean_rows(df)
 
-final_df['Category'] = final_df['Business Name'].apply(categorize_business)
+# Remove any remaining duplicates and sort by business name
+final_df = finish('final_deep_clean', final_df)
 
 # Create the PERFECT government presentation file
 output = '/Users/Jon/Desktop/INDIGENOUS_BUSINESSES_GOVERNMENT_READY.xlsx'
@@ -120,6 +59,10 @@ with pd.ExcelWriter(output, engine='openpyxl') as writer:
 
 print(f"✅ FINAL CLEANING COMPLETE!")
 print(f"📊 Total businesses: {len(final_df)}")
+print_cache_stats()
+print(f"\n🗺️  PROVINCE BREAKDOWN:")
+for province, count in final_df['Province'].value_counts().items():
+    print(f"   {province}: {count}")
 print(f"\n📈 CATEGORY BREAKDOWN:")
 for cat, count in final_df['Category'].value_counts().items():
     print(f"   {cat}: {count}")
@@ -1,5 +1,6 @@
 import pandas as pd
-import re
+
+from cleaning_engine import quality_score_rows, finish
 
 # Load your FINAL clean data
 df = pd.read_excel('/Users/Jon/Desktop/Indigenous_Businesses_FINAL_CLEAN.xlsx')
@@ -18,24 +19,11 @@ print(f"Total businesses: {len(df)}")
 print(f"With addresses: {df['address'].notna().sum()}")
 print(f"With postal codes: {df['postal_code'].notna().sum()}")
 
-# Let's find the best businesses based on what we have
-# Score each business
-df['quality_score'] = 0
-
-# Points for having complete information
-df.loc[df['address'].str.len() > 20, 'quality_score'] += 30
-df.loc[df['postal_code'].notna(), 'quality_score'] += 20
-df.loc[df['business_name'].str.len() > 15, 'quality_score'] += 20
-df.loc[df['phone'].notna(), 'quality_score'] += 10
-
-# Extra points for professional-sounding names
-professional_words = ['Corporation', 'Enterprises', 'Group', 'Services', 'Solutions', 
-                     'Consulting', 'Construction', 'Development', 'Centre', 'Professional']
-for word in professional_words:
-    df.loc[df['business_name'].str.contains(word, case=False, na=False), 'quality_score'] += 10
+# Score each business on complete information and professional-sounding names
+df = quality_score_rows(df)
 
 # Get top 200
-top_200 = df.nlargest(200, 'quality_score').sort_values('business_name')
+top_200 = finish('find_best_200', df)
 
 # Save showcase file
 output_file = '/Users/Jon/Desktop/Indigenous_200_SHOWCASE.xlsx'
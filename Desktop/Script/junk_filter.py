@@ -0,0 +1,75 @@
+import re
+from collections import Counter
+
+import numpy as np
+
+from parsing import scoped
+
+# The cleaners' "skip if" checks on business names as named rules, compiled
+# into one regex per script. Each rule becomes a named alternative anchored at
+# the start of the name, so one match attempt per row finds the first rule (in
+# list order) that rejects it - the same rule the old chain of ifs stopped at.
+
+
+def _words(words):
+    """Whole name equal to one of these words, ignoring case"""
+    return re.compile('(?:' + '|'.join(re.escape(word) for word in words) + r')\Z', re.I)
+
+
+TOO_SHORT = re.compile(r'(?s:.{0,4})\Z')
+
+JUNK_RULES = {
+    'deep_clean': [
+        ('label', re.compile(r'^(phone|fax|tel|fox|tél|téléc|suite|tel\.|fax\.|fox\.)[\s:]*$', re.I)),
+        ('all_caps', re.compile(r'^[A-Z]{2,}[\s]*$', re.I)),      # Just caps like "COMMUNICATION"
+        ('symbols', re.compile(r'^\W+$', re.I)),
+        ('numbers', re.compile(r'^[\d\s\-\(\)]+$', re.I)),
+        ('dots', re.compile(r'^\.+$', re.I)),
+        ('empty', re.compile(r'^\s*$', re.I)),
+        ('too_short', TOO_SHORT),
+    ],
+    # Checked after a leading "(" has been stripped off the name
+    'process_full_database_clean': [
+        ('too_short', TOO_SHORT),
+        ('numbers', re.compile(r'^[\d\s\-\(\)\.]+$')),
+        ('location', _words(['québec', 'quebec', 'montréal', 'montreal', 'kahnawake'])),
+        ('generic', _words(['other', 'fax', 'tel', 'phone', 'street', 'road', 'avenue'])),
+    ],
+    'final_cleanup': [
+        ('placeholder', re.compile(r'(?:nan|Other)?\Z')),
+        ('numbers', re.compile(r'^[\d\s\-\(\)]+$')),
+        ('too_short', TOO_SHORT),
+        ('address', re.compile(r'(?s:.*?)(?:street|road|avenue|main st)', re.I)),
+        ('location', _words(['quebec', 'québec', 'kahnawake', 'wendake'])),
+    ],
+}
+
+
+class JunkFilter:
+    """One script's junk rules as a single regex, with a hit count per rule"""
+
+    def __init__(self, rules):
+        self.names = [name for name, _ in rules]
+        self.pattern = re.compile('^(?:' + '|'.join(f"(?P<{name}>{scoped(pattern)})" for name, pattern in rules)
+                                  + ')')
+        self.hits = Counter()
+
+    def rules(self, text):
+        """Name of the first rule each string breaks, '' for the ones that pass"""
+        matched = text.str.extract(self.pattern)[self.names].notna().to_numpy()
+        first = np.where(matched.any(axis=1), matched.argmax(axis=1), len(self.names))
+        rule = np.asarray(self.names + [''], dtype=object)[first]
+        self.hits.update(name for name in rule if name)
+        return rule
+
+    def junk(self, text):
+        """True for every string some rule rejects"""
+        return self.rules(text) != ''
+
+    def report(self, title="🗑️  Junk rejected by rule:"):
+        print(title)
+        for name in self.names:
+            print(f"   {name:<12} {self.hits[name]:>8,}")
+
+
+JUNK_FILTERS = {script: JunkFilter(rules) for script, rules in JUNK_RULES.items()}
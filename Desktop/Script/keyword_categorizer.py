@@ -0,0 +1,192 @@
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from name_tokens import TOKEN, distinct_tokens, fold, tokenize
+
+# Keyword rules matched against a name's folded tokens (see name_tokens.py)
+# rather than raw substrings. A pattern is one or more terms:
+#
+#   "transport"        the token "transport"
+#   "transport*"       any token starting with it - transports, transporteur
+#   "real estate"      those tokens next to each other
+#   "^garderie*"       only at the start of the name
+#   "health centre$"   only at the end
+#
+# Patterns are folded the same way as names, so "développement" in a rule
+# matches "DEVELOPPEMENT" in the data, and "art" no longer matches "Martin".
+# Every pattern carries an int bitmask and scanning a name ORs together the
+# masks of the patterns in it. Single-word patterns are dict lookups per
+# token, and each distinct token is only resolved once.
+
+
+def parse_pattern(pattern):
+    """(terms, at_start, at_end) for one pattern - each term a (token, is_prefix) pair"""
+    text = pattern.strip()
+    at_start, at_end = text.startswith('^'), text.endswith('$')
+    terms = []
+    for piece in text.strip('^$').split():
+        tokens = TOKEN.findall(fold(piece.rstrip('*')))
+        if tokens:
+            # "porte-à-porte*" is the phrase porte a porte*
+            terms += [(token, False) for token in tokens[:-1]] + [(tokens[-1], piece.endswith('*'))]
+    if not terms:
+        raise ValueError(f"pattern {pattern!r} has no words in it")
+    return tuple(terms), at_start, at_end
+
+
+def _term_matches(term, token):
+    text, prefix = term
+    return token.startswith(text) if prefix else token == text
+
+
+class TokenIndex:
+    """Patterns -> bitmasks, matched against token tuples"""
+
+    def __init__(self, masks):
+        self.exact = {}         # token -> mask of one-word patterns
+        self.prefixes = {}      # prefix -> mask of one-word patterns
+        self.phrases = []       # (mask, terms, at_start, at_end) for everything else
+        self.first_exact = {}   # token -> phrases starting with it
+        self.first_prefix = {}  # prefix -> phrases starting with it
+        for pattern, mask in masks.items():
+            terms, at_start, at_end = parse_pattern(pattern)
+            text, prefix = terms[0]
+            if len(terms) == 1 and not at_start and not at_end:
+                table = self.prefixes if prefix else self.exact
+                table[text] = table.get(text, 0) | mask
+            else:
+                table = self.first_prefix if prefix else self.first_exact
+                table.setdefault(text, []).append(len(self.phrases))
+                self.phrases.append((mask, terms, at_start, at_end))
+        self.prefix_lengths = sorted({len(text) for text in [*self.prefixes, *self.first_prefix]})
+        self.resolved = {}
+
+    def _resolve(self, token):
+        """(mask of the one-word patterns it matches, phrases it can start)"""
+        mask = self.exact.get(token, 0)
+        starts = list(self.first_exact.get(token, ()))
+        for length in self.prefix_lengths:
+            if length > len(token):
+                break
+            mask |= self.prefixes.get(token[:length], 0)
+            starts += self.first_prefix.get(token[:length], ())
+        self.resolved[token] = mask, tuple(starts)
+        return self.resolved[token]
+
+    def _phrase_at(self, number, tokens, i):
+        _, terms, at_start, at_end = self.phrases[number]
+        end = i + len(terms)
+        if (at_start and i) or end > len(tokens) or (at_end and end != len(tokens)):
+            return False
+        return all(_term_matches(term, tokens[i + j]) for j, term in enumerate(terms[1:], 1))
+
+    def scan(self, tokens):
+        """OR of the masks of every pattern in a token tuple"""
+        found = 0
+        for i, token in enumerate(tokens):
+            mask, starts = self.resolved.get(token) or self._resolve(token)
+            found |= mask
+            for number in starts:
+                if self._phrase_at(number, tokens, i):
+                    found |= self.phrases[number][0]
+        return found
+
+    def scan_distinct(self, names, tokens=None):
+        """(factorize codes, mask per distinct name) for a Series - missing names have code -1
+
+        `tokens` is distinct_tokens(names), when the caller already has it.
+        """
+        codes, distinct = tokens if tokens is not None else distinct_tokens(names)
+        return codes, [self.scan(words) for words in distinct]
+
+
+class KeywordCategorizer:
+    """Names -> categories from (category, patterns) or (category, patterns, unless) rules
+
+    Rules are checked in order and the first one with any of its patterns in
+    the name wins - unless the name also has one of that rule's `unless`
+    patterns, in which case the next rules get their turn. Names no rule
+    takes get the default.
+    """
+
+    def __init__(self, rules, default):
+        self.categories = [rule[0] for rule in rules]
+        self.default = default
+        # Bit i: a pattern of rule i; bit len(rules) + i: an unless pattern of rule i
+        masks = {}
+        for i, rule in enumerate(rules):
+            unless = rule[2] if len(rule) > 2 else []
+            for pattern in rule[1]:
+                masks[pattern] = masks.get(pattern, 0) | 1 << i
+            for pattern in unless:
+                masks[pattern] = masks.get(pattern, 0) | 1 << (len(rules) + i)
+        self.index = TokenIndex(masks)
+
+    @lru_cache(maxsize=None)
+    def _pick(self, found):
+        """Category for the set of rule/unless bits a name hit"""
+        count = len(self.categories)
+        for i, category in enumerate(self.categories):
+            if found >> i & 1 and not found >> (count + i) & 1:
+                return category
+        return self.default
+
+    def category(self, name):
+        """Category for one name"""
+        if not isinstance(name, str):
+            return self.default
+        return self._pick(self.index.scan(tokenize(name)))
+
+    def categorize(self, names, tokens=None):
+        """Category for every name in a Series
+
+        Each distinct name is tokenized and scanned once and the results are
+        broadcast back by factorize code - OCR output repeats the same
+        names over and over. Pass `tokens` (distinct_tokens(names)) to reuse
+        a tokenization done for a filter.
+        """
+        codes, masks = self.index.scan_distinct(names, tokens)
+        # Missing names get code -1, which lands on the default at the end
+        table = np.asarray([self._pick(mask) for mask in masks] + [self.default], dtype=object)
+        return pd.Series(table[codes], index=names.index, dtype=object)
+
+
+class TokenFilter:
+    """Named rules of patterns a name must not contain, with a hit count per rule
+
+    Every rule gets one bit, so one scan of each distinct name finds all the
+    rules it breaks - the first of them, in rule order, is the one reported.
+    Same rules()/report() shape as junk_filter.JunkFilter.
+    """
+
+    def __init__(self, rules):
+        self.names = [name for name, _ in rules]
+        masks = {}
+        for i, (_, patterns) in enumerate(rules):
+            for pattern in patterns:
+                masks[pattern] = masks.get(pattern, 0) | 1 << i
+        self.index = TokenIndex(masks)
+        self.hits = Counter()
+
+    def rules(self, names, tokens=None):
+        """Id of the first rule each name breaks, '' for the ones that pass - `tokens` as for categorize()"""
+        codes, masks = self.index.scan_distinct(names, tokens)
+        first = [self.names[(mask & -mask).bit_length() - 1] if mask else '' for mask in masks]
+        rows = np.bincount(codes[codes >= 0], minlength=len(masks))
+        for name, count in zip(first, rows.tolist()):
+            if name:
+                self.hits[name] += count
+        # Missing names get code -1, which lands on '' at the end
+        return np.asarray(first + [''], dtype=object)[codes]
+
+    def matches(self, names, tokens=None):
+        """True for every name some rule catches"""
+        return pd.Series(self.rules(names, tokens) != '', index=names.index, dtype=bool)
+
+    def report(self, title):
+        print(title)
+        for name in self.names:
+            print(f"   {name:<12} {self.hits[name]:>8,}")
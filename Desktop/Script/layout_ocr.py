@@ -0,0 +1,186 @@
+import re
+from statistics import median
+
+import numpy as np
+
+from parsing import PHONE, POSTAL_CODE, ADDRESS_START, format_phone
+
+# Layout-aware parsing of tesseract's word-level TSV output (image_to_data).
+# Instead of regexing over the flat page text - which glues the two columns of a
+# directory page together line by line - we find the column gutters from the word
+# bounding boxes, rebuild lines per column, cut each column into listing blocks
+# and parse each block on its own.
+
+LABEL_PATTERN = re.compile(r'^(t[ée]l[ée]?c?|tel|fax|fox|phone|t[ée]l[ée]phone)\.?\s*:?\s*$', re.I)
+
+
+def read_words(tsv):
+    """Word boxes from image_to_data TSV text - level 5 rows with actual text"""
+    words = []
+    lines = tsv.splitlines()
+    for line in lines[1:]:
+        parts = line.split('\t')
+        if len(parts) < 12 or parts[0] != '5':
+            continue
+        text = parts[11].strip()
+        if not text:
+            continue
+        words.append({
+            'block': int(parts[2]),
+            'par': int(parts[3]),
+            'line': int(parts[4]),
+            'left': int(parts[6]),
+            'top': int(parts[7]),
+            'width': int(parts[8]),
+            'height': int(parts[9]),
+            'conf': float(parts[10]),
+            'text': text,
+        })
+    return words
+
+
+def find_column_edges(words, min_gutter=None):
+    """x positions that split the page into text columns (empty list = single column)
+
+    A gutter is a vertical strip that (almost) no text line crosses. A couple of
+    lines are allowed through so a page-wide header doesn't hide the gutter.
+    """
+    if not words:
+        return []
+    page_right = max(w['left'] + w['width'] for w in words)
+    page_left = min(w['left'] for w in words)
+    if min_gutter is None:
+        min_gutter = 2 * median(w['height'] for w in words)
+
+    # How many words sit over each x position - the spaces between words don't
+    # line up from one line to the next, so only real gutters stay near zero
+    coverage = np.zeros(page_right + 1, dtype=np.int32)
+    for w in words:
+        coverage[w['left']:w['left'] + w['width']] += 1
+    n_lines = len({(w['block'], w['par'], w['line']) for w in words})
+    allowed = max(1, n_lines // 20)
+
+    edges = []
+    run_start = None
+    for x in range(page_left, page_right + 1):
+        if coverage[x] <= allowed:
+            if run_start is None:
+                run_start = x
+        else:
+            if run_start is not None and x - run_start >= min_gutter:
+                edges.append((run_start + x) // 2)
+            run_start = None
+    return edges
+
+
+def column_lines(words, edges):
+    """Rebuild text lines separately for each column, top to bottom"""
+    columns = [[] for _ in range(len(edges) + 1)]
+    grouped = {}
+    for w in words:
+        center = w['left'] + w['width'] / 2
+        col = sum(1 for edge in edges if center > edge)
+        grouped.setdefault((col, w['block'], w['par'], w['line']), []).append(w)
+
+    for (col, _, _, _), line_words in grouped.items():
+        line_words.sort(key=lambda w: w['left'])
+        columns[col].append({
+            'text': ' '.join(w['text'] for w in line_words),
+            'top': min(w['top'] for w in line_words),
+            'bottom': max(w['top'] + w['height'] for w in line_words),
+            'words': line_words,
+        })
+    for lines in columns:
+        lines.sort(key=lambda line: line['top'])
+    return columns
+
+
+def listing_blocks(lines):
+    """Cut one column into listings - a blank vertical gap or a phone number ends a listing"""
+    if not lines:
+        return []
+    line_height = median(line['bottom'] - line['top'] for line in lines)
+    blocks = []
+    current = []
+    previous_bottom = None
+    for line in lines:
+        if current and previous_bottom is not None and line['top'] - previous_bottom > 0.9 * line_height:
+            blocks.append(current)
+            current = []
+        current.append(line)
+        previous_bottom = line['bottom']
+        if PHONE.search(line['text']):
+            blocks.append(current)
+            current = []
+            previous_bottom = None
+    if current:
+        blocks.append(current)
+    return blocks
+
+
+def parse_listing(block, folder_name):
+    """Structured records from one listing block - one per phone number in it"""
+    records = []
+    text = '\n'.join(line['text'] for line in block)
+    # Where each line starts in `text`, to find the words behind each record
+    line_starts = []
+    offset = 0
+    for line in block:
+        line_starts.append(offset)
+        offset += len(line['text']) + 1
+
+    previous_end = 0
+    for match in PHONE.finditer(text):
+        segment = text[previous_end:match.start()]
+        segment_start = previous_end
+        previous_end = match.end()
+        parts = [part.strip(' ,_-') for part in segment.split('\n')]
+        parts = [part for part in parts if part and not LABEL_PATTERN.match(part)]
+        if not parts:
+            continue
+
+        first = parts[0]
+        rest = parts[1:]
+        address_match = ADDRESS_START.search(first)
+        if address_match and address_match.start() > 0:
+            business_name = first[:address_match.start()].strip(' ,.-_')
+            rest = [first[address_match.start():].strip()] + rest
+        else:
+            business_name = first.strip(' ,.-_')
+        address = ', '.join(rest)
+        full_text = ' '.join(parts)
+        postal_match = POSTAL_CODE.search(full_text)
+
+        confs = [w['conf'] for line, start in zip(block, line_starts)
+                 if start < match.end() and start + len(line['text']) >= segment_start
+                 for w in line['words'] if w['conf'] >= 0]
+
+        if full_text and len(full_text) > 3:
+            records.append({
+                'name': full_text,
+                'phone': format_phone(match),
+                'folder': folder_name,
+                'business_name': business_name,
+                'address': address,
+                'postal_code': postal_match.group(0) if postal_match else '',
+                'confidence': round(sum(confs) / len(confs), 1) if confs else 0.0,
+                'min_confidence': min(confs) if confs else 0.0,
+            })
+    return records
+
+
+def page_confidence(tsv):
+    """Mean tesseract word confidence (0-100) over the whole page"""
+    confs = [w['conf'] for w in read_words(tsv) if w['conf'] >= 0]
+    return sum(confs) / len(confs) if confs else 0.0
+
+
+def parse_layout(tsv, folder_name):
+    """All listing records on one page, column by column, top to bottom"""
+    words = read_words(tsv)
+    edges = find_column_edges(words)
+    records = []
+    for lines in column_lines(words, edges):
+        for block in listing_blocks(lines):
+            records.extend(parse_listing(block, folder_name))
+    return records
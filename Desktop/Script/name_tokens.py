@@ -0,0 +1,36 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+import pandas as pd
+
+# Business names as accent-folded word tokens: NFKD splits "é" into "e" plus a
+# combining accent, the accent is dropped and the rest case-folded, so
+# "Développement", "DEVELOPPEMENT" and "développement" all come out as
+# "developpement" - OCR drops accents often enough that rules can't rely on
+# them. Tokens are runs of letters and digits; "l'École" gives ("l", "ecole").
+
+TOKEN = re.compile(r'[^\W_]+')
+CACHE_SIZE = 200000
+
+
+def fold(text):
+    """Lowercase text with accents stripped"""
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def tokenize(text):
+    """Tuple of folded tokens for one name"""
+    return tuple(TOKEN.findall(fold(text)))
+
+
+def distinct_tokens(names):
+    """(factorize codes, token tuple per distinct name) for a Series - missing names have code -1
+
+    Filters and categorizers that look at the same names can share one of
+    these instead of each tokenizing the column again.
+    """
+    codes, uniques = pd.factorize(names)
+    return codes, [tokenize(name) if isinstance(name, str) else () for name in uniques]
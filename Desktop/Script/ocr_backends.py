@@ -0,0 +1,104 @@
+from functools import lru_cache
+
+import pytesseract
+
+from ocr_cache import OCR_LANG
+
+# Two ways to run tesseract behind the same two calls the extractor needs
+# (flat text and word-level TSV):
+#
+#   'subprocess' - pytesseract, which forks a tesseract process per page, writes
+#                  temp files and reloads the fra+eng traineddata every time
+#   'persistent' - tesserocr, which keeps one engine loaded in-process (one per
+#                  pool worker) and reuses it for every page
+#
+# tesserocr is optional: pip install tesserocr
+#
+# The two can link different libtesseract builds and so OCR the same page
+# differently - cache keys say which backend made an entry (backend_tag).
+
+TSV_HEADER = "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext"
+
+
+class SubprocessBackend:
+    """pytesseract - one tesseract process per page"""
+
+    name = 'subprocess'
+
+    def __init__(self, lang=OCR_LANG):
+        self.lang = lang
+
+    def image_to_string(self, img, config=''):
+        return pytesseract.image_to_string(img, lang=self.lang, config=config)
+
+    def image_to_data(self, img, config=''):
+        return pytesseract.image_to_data(img, lang=self.lang, config=config)
+
+
+class PersistentBackend:
+    """tesserocr - the engine and its traineddata stay loaded across pages"""
+
+    name = 'persistent'
+
+    def __init__(self, lang=OCR_LANG):
+        try:
+            import tesserocr
+        except ImportError:
+            raise ImportError("the persistent OCR backend needs tesserocr - pip install tesserocr")
+        self.lang = lang
+        self.api = tesserocr.PyTessBaseAPI(lang=lang)
+
+    @staticmethod
+    def version():
+        import tesserocr
+        return tesserocr.tesseract_version().split()[1]
+
+    def _set_image(self, img, config):
+        # The extractor only passes --dpi (preprocessing) and --psm (low-confidence retries)
+        import tesserocr
+        parts = config.split()
+        dpi = parts[parts.index('--dpi') + 1] if '--dpi' in parts else '0'
+        psm = int(parts[parts.index('--psm') + 1]) if '--psm' in parts else tesserocr.PSM.AUTO
+        self.api.SetVariable('user_defined_dpi', dpi)
+        self.api.SetPageSegMode(psm)
+        self.api.SetImage(img)
+
+    def image_to_string(self, img, config=''):
+        self._set_image(img, config)
+        return self.api.GetUTF8Text()
+
+    def image_to_data(self, img, config=''):
+        # Same columns as pytesseract's image_to_data, which includes the header row
+        self._set_image(img, config)
+        return TSV_HEADER + "\n" + self.api.GetTSVText(0)
+
+    def close(self):
+        self.api.End()
+
+
+BACKENDS = {
+    'subprocess': SubprocessBackend,
+    'persistent': PersistentBackend,
+}
+
+_loaded = {}
+
+
+@lru_cache(maxsize=None)
+def backend_tag(name='subprocess'):
+    """What a backend adds to OCR cache keys
+
+    Every key already has the tesseract binary's version, which is what
+    'subprocess' runs, so it adds nothing and existing entries stay valid.
+    Other backends add their name and the libtesseract version they link.
+    """
+    if name == 'subprocess':
+        return ''
+    return f"{name}:{BACKENDS[name].version()}"
+
+
+def get_backend(name='subprocess'):
+    """The backend for this process - created once, then reused for every page"""
+    if name not in _loaded:
+        _loaded[name] = BACKENDS[name]()
+    return _loaded[name]
@@ -0,0 +1,202 @@
+import sqlite3
+import hashlib
+import os
+import time
+import argparse
+from functools import lru_cache
+
+import pytesseract
+
+# On the local disk - SQLite's WAL needs shared memory between the processes
+# using it, which a network mount (where the screenshots live) can't give it
+DEFAULT_CACHE_PATH = "/Users/Jon/Desktop/.ocr_cache/ocr_cache.sqlite"
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024  # 500 MB of OCR text is a LOT of pages
+OCR_LANG = 'fra+eng'
+
+
+@lru_cache(maxsize=None)
+def tesseract_version():
+    """Installed tesseract version - part of the key so an upgrade re-OCRs everything"""
+    try:
+        return str(pytesseract.get_tesseract_version())
+    except pytesseract.TesseractNotFoundError:
+        # No tesseract binary - the persistent backend links libtesseract directly
+        import tesserocr
+        return tesserocr.tesseract_version().split()[1]
+
+
+def image_hash(data):
+    """Content hash of the raw PNG bytes"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def cache_key(img_hash, lang=OCR_LANG, version=None, variant='text'):
+    """Key = image content + language + tesseract version + what kind of OCR output it is"""
+    version = version or tesseract_version()
+    return hashlib.sha256(f"{img_hash}|{lang}|{version}|{variant}".encode('utf-8')).hexdigest()
+
+
+def _text_sha(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class OCRCache:
+    """Persistent on-disk OCR results, keyed by image hash, with an LRU size cap"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Pool workers each open their own connection; WAL lets them write side by side
+        self.conn = sqlite3.connect(path, timeout=60)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS ocr_results (
+                key TEXT PRIMARY KEY,
+                image_hash TEXT NOT NULL,
+                lang TEXT NOT NULL,
+                version TEXT NOT NULL,
+                variant TEXT NOT NULL,
+                text TEXT NOT NULL,
+                text_sha TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                last_used REAL NOT NULL
+            )""")
+        # LRU order plus each entry's size, so SUM(size) and eviction read this
+        # index instead of every cached page's text
+        self.conn.execute("DROP INDEX IF EXISTS idx_last_used")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_lru ON ocr_results (last_used, size)")
+        self.conn.commit()
+
+    def total_bytes(self):
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM ocr_results").fetchone()[0]
+
+    def get(self, key):
+        """Cached OCR text or None - a hit bumps the entry to most recently used"""
+        row = self.conn.execute("SELECT text FROM ocr_results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.conn.execute("UPDATE ocr_results SET last_used = ? WHERE key = ?", (time.time(), key))
+        self.conn.commit()
+        return row[0]
+
+    def put(self, key, img_hash, text, lang=OCR_LANG, version=None, variant='text'):
+        """Store OCR text for an image, evicting least recently used entries past the cap"""
+        version = version or tesseract_version()
+        size = len(text.encode('utf-8'))
+        now = time.time()
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO ocr_results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, img_hash, lang, version, variant, text, _text_sha(text), size, now, now))
+            # Every pool worker writes to this file, so the total comes from the
+            # table - read while this transaction holds the write lock
+            if self.total_bytes() > self.max_bytes:
+                self._evict()
+
+    def evict(self):
+        """Drop least recently used entries until we're back under the size cap"""
+        with self.conn:
+            return self._evict()
+
+    def _evict(self):
+        total = self.total_bytes()
+        doomed = []
+        for key, size in self.conn.execute("SELECT key, size FROM ocr_results ORDER BY last_used"):
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        self.conn.executemany("DELETE FROM ocr_results WHERE key = ?", doomed)
+        return len(doomed)
+
+    def verify(self, lang=OCR_LANG, version=None):
+        """Check the database and every entry's checksum, purging bad or stale entries"""
+        integrity = self.conn.execute("PRAGMA integrity_check").fetchone()[0]
+        version = version or tesseract_version()
+        corrupt = []
+        stale = []
+        for key, text, text_sha, entry_lang, entry_version in self.conn.execute(
+                "SELECT key, text, text_sha, lang, version FROM ocr_results"):
+            if _text_sha(text) != text_sha:
+                corrupt.append((key,))
+            elif entry_lang != lang or entry_version != version:
+                stale.append((key,))
+        self.conn.executemany("DELETE FROM ocr_results WHERE key = ?", corrupt + stale)
+        self.conn.commit()
+        return {'integrity': integrity, 'corrupt': len(corrupt), 'stale': len(stale)}
+
+    def stats(self):
+        entries = self.conn.execute("SELECT COUNT(*) FROM ocr_results").fetchone()[0]
+        return {'entries': entries, 'bytes': self.total_bytes(), 'max_bytes': self.max_bytes}
+
+    def clear(self):
+        self.conn.execute("DELETE FROM ocr_results")
+        self.conn.commit()
+        self.conn.execute("VACUUM")
+
+    def close(self):
+        self.conn.close()
+
+
+def main():
+    # Imported here - extract_businesses imports this module at the top
+    import extract_businesses
+
+    parser = argparse.ArgumentParser(description="Inspect and maintain the OCR result cache")
+    parser.add_argument('command', choices=['stats', 'verify', 'rebuild', 'clear'])
+    parser.add_argument('--path', default=DEFAULT_CACHE_PATH)
+    parser.add_argument('--max-mb', type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024))
+    parser.add_argument('--workers', type=int, default=0,
+                        help="OCR processes for rebuild (0 = one per CPU core)")
+    parser.add_argument('--engine', choices=sorted(extract_businesses.ENGINES), default='text',
+                        help="which extraction engine's OCR output to warm")
+    args = parser.parse_args()
+
+    cache = OCRCache(args.path, max_bytes=args.max_mb * 1024 * 1024)
+
+    if args.command == 'stats':
+        stats = cache.stats()
+        print(f"📦 {stats['entries']:,} cached pages, {stats['bytes'] / 1024 / 1024:.1f} MB "
+              f"of {stats['max_bytes'] / 1024 / 1024:.0f} MB cap")
+
+    elif args.command == 'verify':
+        result = cache.verify()
+        print(f"🔍 SQLite integrity: {result['integrity']}")
+        print(f"🧹 Removed {result['corrupt']} corrupt and {result['stale']} stale entries")
+
+    elif args.command == 'rebuild':
+        # Verify first, then re-OCR whatever is missing so the next extraction is all hits
+        result = cache.verify()
+        print(f"🧹 Removed {result['corrupt']} corrupt and {result['stale']} stale entries")
+        cache.close()
+        tasks = extract_businesses.list_png_files()
+        print(f"🔄 Warming cache from {len(tasks)} PNG files...")
+        hits = 0
+        failed = 0
+        workers = args.workers or os.cpu_count()
+        for result in extract_businesses.ocr_pages(tasks, workers, args.path, args.engine):
+            if result.error:
+                failed += 1
+                extract_businesses._report_error(result)
+            else:
+                hits += result.cached
+        print(f"✅ {hits} already cached, {len(tasks) - hits - failed} re-OCR'd")
+        if failed:
+            print(f"⚠️  {failed} files failed - see messages above")
+        cache = OCRCache(args.path, max_bytes=args.max_mb * 1024 * 1024)
+
+    elif args.command == 'clear':
+        cache.clear()
+        print("🗑️  Cache cleared")
+
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
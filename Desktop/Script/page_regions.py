@@ -0,0 +1,121 @@
+import numpy as np
+from PIL import ImageFilter
+
+from preprocess import binarize
+
+# Only the listing area of a screenshot goes to tesseract - browser chrome,
+# sidebars and page headers cost OCR time and come back as junk lines.
+#
+# Per folder: 'auto' boxes all the text and trims outer chrome bands, a
+# (left, top, right, bottom) tuple of page fractions crops a fixed box,
+# and None sends the whole page.
+FOLDER_REGIONS = {
+    'Data 1': 'auto',
+    'Data2': 'auto',
+}
+
+DETECT_SCALE = 4          # detect on a 1/4 size thumbnail - plenty for finding columns
+MIN_DENSITY = 0.02        # share of a row's pixels that must be ink for it to count as text
+MIN_COLUMN_DENSITY = 0.01  # same for a column, within the text rows
+MAX_COLUMN_GAP = 0.02     # gutters up to this share of page width join the runs on either side
+MAX_ROW_GAP = 0.04        # blank bands up to this share of page height join the runs on either side
+CHROME_BAND = 0.06        # a run this thin (share of the page) against the page edge can be chrome...
+CHROME_EDGE = 0.03        # ..."against the edge" meaning within this share of it...
+CHROME_GAP = 0.08         # ...when this much blank space sets it apart from the rest
+MARGIN = 0.01
+
+
+def _runs(mask, max_gap):
+    """(start, end) runs of True, bridging gaps of up to max_gap False values"""
+    runs = []
+    start = None
+    gap = 0
+    for i, on in enumerate(mask):
+        if on:
+            if start is None:
+                start = i
+            gap = 0
+            end = i + 1
+        elif start is not None:
+            gap += 1
+            if gap > max_gap:
+                runs.append((start, end))
+                start = None
+    if start is not None:
+        runs.append((start, end))
+    return runs
+
+
+def _text_span(profile, threshold, max_gap, length):
+    """(start, end) covering every text run, minus chrome runs at either end
+
+    A run only counts as chrome - a browser bar, a page footer, a sidebar -
+    when it's a thin band against the page edge with a wide blank band
+    between it and the rest. Listings are separated by blank bands too, but
+    never ones that wide, so nothing between the first and last listing is
+    lost; at worst some chrome gets OCR'd.
+    """
+    runs = _runs(profile > threshold, max_gap)
+    if not runs:
+        return 0, len(profile)
+
+    def chrome(run, edge_gap, gap):
+        return (run[1] - run[0] <= CHROME_BAND * length and edge_gap <= CHROME_EDGE * length
+                and gap >= CHROME_GAP * length)
+
+    if len(runs) > 1 and chrome(runs[0], runs[0][0], runs[1][0] - runs[0][1]):
+        runs.pop(0)
+    if len(runs) > 1 and chrome(runs[-1], length - runs[-1][1], runs[-1][0] - runs[-2][1]):
+        runs.pop()
+    return runs[0][0], runs[-1][1]
+
+
+def detect_listing_region(img):
+    """(left, top, right, bottom) pixel box around all the text on a page
+
+    Rows first: the box runs from the first text row to the last, except
+    for outer bands that stand apart like chrome (see _text_span). Then the
+    same for columns within those rows, which drops sidebars set off by a
+    wide gutter.
+    """
+    gray = img.convert('L')
+    thumb = gray.reduce(DETECT_SCALE) if min(img.size) > DETECT_SCALE * 50 else gray
+    scale = img.width / thumb.width
+    pixels = np.asarray(thumb)
+    # Light-on-dark text counts too - ad panels and web banners set contact details that way
+    dark = np.asarray(thumb.filter(ImageFilter.BoxBlur(7))) < 200
+    ink = binarize(pixels, window=15, k=0.15) | (binarize(255 - pixels, window=15, k=0.15) & dark)
+    h, w = ink.shape
+    if not ink.any():
+        return (0, 0, img.width, img.height)
+
+    top, bottom = _text_span(ink.mean(axis=1), MIN_DENSITY, int(MAX_ROW_GAP * h), h)
+    left, right = _text_span(ink[top:bottom].mean(axis=0), MIN_COLUMN_DENSITY, int(MAX_COLUMN_GAP * w), w)
+
+    pad_x, pad_y = int(MARGIN * w), int(MARGIN * h)
+    box = (max(0, left - pad_x), max(0, top - pad_y), min(w, right + pad_x), min(h, bottom + pad_y))
+    return tuple(int(round(v * scale)) for v in box)
+
+
+def region_tag(region):
+    """Short id for a region spec - part of the OCR/preprocess cache keys"""
+    if region is None:
+        return 'full'
+    if region == 'auto':
+        return 'auto2'
+    return 'box' + '-'.join(f"{v:.3f}" for v in region)
+
+
+def crop_to_region(img, region):
+    """Crop a page to its listing area according to a FOLDER_REGIONS spec"""
+    if region is None:
+        return img
+    if region == 'auto':
+        box = detect_listing_region(img)
+    else:
+        left, top, right, bottom = region
+        box = (int(left * img.width), int(top * img.height), int(right * img.width), int(bottom * img.height))
+    cropped = img.crop(box)
+    # Keep the dpi tag so DPI normalization still knows what it's looking at
+    cropped.info.update({k: v for k, v in img.info.items() if k == 'dpi'})
+    return cropped
@@ -0,0 +1,124 @@
+import re
+from functools import lru_cache
+
+import pandas as pd
+
+# Postal code, phone and address patterns shared by the extractor and every
+# cleaner - compiled once here instead of re-parsed inside each row loop - plus
+# batch versions that work on a whole Series at a time.
+
+POSTAL_CODE = re.compile(r'([A-Z]\d[A-Z]\s*\d[A-Z]\d)')
+PHONE = re.compile(r'\((\d{3})\)\s*(\d{3})-(\d{4})')
+
+# First token that looks like the start of an address - loose (anything starting
+# with a number) for raw OCR lines, strict (number + street word) for cleaned names
+ADDRESS_START = re.compile(r'(\d+[\s,]|rue|boul|avenue|route|chemin|CP|C\.P\.|av\.|blvd)', re.I)
+STREET_ADDRESS = re.compile(
+    r'(\d+[\s,]+(?:rue|boul|avenue|road|drive|street|chemin)|P\.?O\.?\s*Box|General Delivery|Suite\s+\d+)', re.I)
+
+# Province names and abbreviations as they show up in the directory listings.
+# Codes only count in capitals - "on" is a word in both languages - names in any case.
+PROVINCE_CODES = {
+    'QC': 'Quebec', 'PQ': 'Quebec', 'ON': 'Ontario', 'NB': 'New Brunswick', 'NS': 'Nova Scotia',
+    'PE': 'Prince Edward Island', 'PEI': 'Prince Edward Island', 'NL': 'Newfoundland and Labrador',
+    'MB': 'Manitoba', 'SK': 'Saskatchewan', 'AB': 'Alberta', 'BC': 'British Columbia',
+    'YT': 'Yukon', 'NT': 'Northwest Territories', 'NU': 'Nunavut',
+}
+PROVINCE_NAMES = {
+    'québec': 'Quebec', 'quebec': 'Quebec', 'ontario': 'Ontario',
+    'new brunswick': 'New Brunswick', 'nouveau-brunswick': 'New Brunswick',
+    'nova scotia': 'Nova Scotia', 'nouvelle-écosse': 'Nova Scotia',
+    'prince edward island': 'Prince Edward Island', 'île-du-prince-édouard': 'Prince Edward Island',
+    'newfoundland': 'Newfoundland and Labrador', 'terre-neuve': 'Newfoundland and Labrador',
+    'manitoba': 'Manitoba', 'saskatchewan': 'Saskatchewan', 'alberta': 'Alberta',
+    'british columbia': 'British Columbia', 'colombie-britannique': 'British Columbia',
+    'yukon': 'Yukon', 'northwest territories': 'Northwest Territories', 'nunavut': 'Nunavut',
+}
+
+
+def _longest_first(words):
+    return '|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+
+
+# Whole words only, longest first so "New Brunswick" wins over a shorter overlap
+PROVINCE = re.compile(rf"\b(?:(?i:{_longest_first(PROVINCE_NAMES)})|{_longest_first(PROVINCE_CODES)})\b")
+
+
+def province_name(token):
+    """Full province name for a PROVINCE match"""
+    return PROVINCE_CODES.get(token) or PROVINCE_NAMES[token.lower()]
+
+
+def format_phone(match):
+    """(xxx) xxx-xxxx from a PHONE match"""
+    return f"({match.group(1)}) {match.group(2)}-{match.group(3)}"
+
+
+def find_postal_codes(text, pattern=POSTAL_CODE):
+    """First postal code in each string of a Series, '' where there is none"""
+    return text.str.extract(pattern, expand=False).fillna('').astype(object)
+
+
+def split_at(text, pattern):
+    """(before, from, matched) around the first match of pattern in each string
+
+    Rows without a match come back as (text, '', False).
+    """
+    parts = text.str.extract(f"^(.*?)((?:{pattern.pattern}).*)$", flags=pattern.flags | re.S)
+    matched = parts[1].notna()
+    return parts[0].where(matched, text).astype(object), parts[1].fillna('').astype(object), matched
+
+
+def remove_each(text, parts):
+    """str.replace() a different literal out of every row"""
+    return pd.Series([t.replace(p, '') for t, p in zip(text, parts)], index=text.index, dtype=object)
+
+
+def scoped(pattern):
+    """A compiled pattern as a group that keeps its own case sensitivity inside a bigger regex"""
+    return f"(?i:{pattern.pattern})" if pattern.flags & re.I else f"(?:{pattern.pattern})"
+
+
+@lru_cache(maxsize=None)
+def scanner(address=ADDRESS_START):
+    """One regex that finds postal codes and address starts in a single pass
+
+    Alternatives are tried in that order at each position, so a postal code
+    wins over an address token starting on the same character. Each part keeps
+    its own case sensitivity.
+    """
+    return re.compile(f"(?P<postal>{scoped(POSTAL_CODE)})|(?P<address>{scoped(address)})")
+
+
+def scan(text, address=ADDRESS_START):
+    """(postal code, address start offset) for one string - ('', -1) when absent
+
+    Same answers as separate POSTAL_CODE and address searches. finditer never
+    returns overlapping matches, so an address token starting inside the
+    postal code ("J0L 1B0, chemin ...") is searched for on its own.
+    """
+    postal, start = '', -1
+    for match in scanner(address).finditer(text):
+        if match.lastgroup == 'address':
+            if start < 0:
+                start = match.start()
+            continue
+        postal = match.group()
+        if start < 0:
+            found = address.search(text, match.start() + 1)
+            start = found.start() if found else -1
+        break
+    return postal, start
+
+
+def scan_series(text, address=ADDRESS_START):
+    """scan() over a whole Series - DataFrame with postal_code and address_start"""
+    found = [scan(t, address) for t in text]
+    return pd.DataFrame(found, columns=['postal_code', 'address_start'], index=text.index)
+
+
+def split_scanned(text, starts):
+    """(before, from) each string at its scanned address start - (text, '') where there was none"""
+    before = [t[:s] if s >= 0 else t for t, s in zip(text, starts)]
+    after = [t[s:] if s >= 0 else '' for t, s in zip(text, starts)]
+    return pd.Series(before, index=text.index, dtype=object), pd.Series(after, index=text.index, dtype=object)
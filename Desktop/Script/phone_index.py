@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+
+# Phone numbers as int64 E.164 digits (1 + area code + number, e.g. 14185551234)
+# instead of "(418) 555-1234" strings with 'nan' stand-ins. 0 means no usable
+# phone. Ints compare, hash, group and dedup much faster than strings and take
+# 8 bytes a row.
+#
+# 0 is not the same as missing: OCR garbles area codes ("(123) 555-1234") and
+# drops them ("555-1234"), and those rows are still real listings. The
+# cleaners keep the original text for them and dedup on it (phone_keys).
+
+NO_PHONE = 0
+
+
+def normalize_phones(phones):
+    """int64 E.164 phone per row of a Series - NO_PHONE where there isn't a valid NANP number"""
+    if pd.api.types.is_numeric_dtype(phones):
+        # Excel sometimes hands phones back as plain numbers
+        text = phones.fillna(0).astype('int64').astype(str)
+    else:
+        text = phones.astype(object).where(phones.notna(), '').map(str)
+    digits = text.str.replace(r'\D+', '', regex=True)
+    length = digits.str.len()
+    national = digits.str[-10:]
+    valid = (((length == 10) | ((length == 11) & digits.str.startswith('1')))
+             & national.str[0].isin(list('23456789')))
+    numbers = pd.to_numeric(('1' + national).where(valid, '0')).astype('int64')
+    return pd.Series(numbers.to_numpy(), index=phones.index, dtype='int64')
+
+
+def format_phones(numbers):
+    """(xxx) xxx-xxxx for each int64 E.164 phone, '' for NO_PHONE"""
+    national = (numbers % 10 ** 10).astype(str).str.zfill(10)
+    text = '(' + national.str[:3] + ') ' + national.str[3:6] + '-' + national.str[6:]
+    return text.where(numbers != NO_PHONE, '').astype(object)
+
+
+def phone_text(text, numbers):
+    """(xxx) xxx-xxxx where the phone normalized, the original text where it didn't"""
+    return format_phones(numbers).where(numbers != NO_PHONE, text).astype(object)
+
+
+def phone_keys(numbers, text):
+    """int64 dedup key per row: the E.164 phone, or a negative hash of the text where there isn't one
+
+    Valid phones are positive, so the two kinds never collide - and rows
+    whose phone didn't normalize only match rows with the same text.
+    """
+    hashed = pd.util.hash_pandas_object(text.astype(object), index=False).to_numpy() >> np.uint64(1)
+    fallback = -hashed.astype(np.int64) - 1
+    keys = np.where(numbers.to_numpy() != NO_PHONE, numbers.to_numpy(), fallback)
+    return pd.Series(keys, index=numbers.index, dtype='int64')
+
+
+def format_phone_number(number):
+    """(xxx) xxx-xxxx for one int64 E.164 phone"""
+    if number == NO_PHONE:
+        return ''
+    national = f"{number % 10 ** 10:010d}"
+    return f"({national[:3]}) {national[3:6]}-{national[6:]}"
+
+
+class PhoneIndex:
+    """Hash index from phone (or phone_keys() key) to the ids of the records that use it
+
+    Built with one stable sort: record ids are grouped by phone in a single
+    array and a dict maps each phone to its slice of it.
+    """
+
+    def __init__(self, phones, ids=None):
+        # A column read back from Excel has NaN for blank cells - those are NO_PHONE
+        phones = pd.Series(np.asarray(phones, dtype=object)).fillna(NO_PHONE).astype('int64').to_numpy()
+        ids = np.arange(len(phones)) if ids is None else np.asarray(ids)
+        order = np.argsort(phones, kind='stable')
+        unique, starts, counts = np.unique(phones[order], return_index=True, return_counts=True)
+        self.ids = ids[order]
+        self.slots = {phone: (start, start + count)
+                      for phone, start, count in zip(unique.tolist(), starts.tolist(), counts.tolist())
+                      if phone != NO_PHONE}
+
+    def lookup(self, phone):
+        """Record ids using this phone (int E.164 or any written form) - empty if none"""
+        if not isinstance(phone, (int, np.integer)):
+            phone = int(normalize_phones(pd.Series([phone]))[0])
+        start, end = self.slots.get(int(phone), (0, 0))
+        return self.ids[start:end]
+
+    def __contains__(self, phone):
+        return len(self.lookup(phone)) > 0
+
+    def __len__(self):
+        return len(self.slots)
+
+    def counts(self):
+        """Records per phone, most used first"""
+        counts = pd.Series({phone: end - start for phone, (start, end) in self.slots.items()}, dtype='int64')
+        return counts.sort_values(ascending=False, kind='stable')
+
+    def duplicates(self, min_count=2):
+        """Phones shared by at least min_count records, most used first"""
+        counts = self.counts()
+        return counts[counts >= min_count]
@@ -0,0 +1,146 @@
+import io
+import os
+import json
+import hashlib
+
+import numpy as np
+from PIL import Image
+
+# Clean up a screenshot before tesseract sees it: grayscale, DPI normalization,
+# adaptive binarization and deskew. Everything is whole-array NumPy/Pillow work,
+# no per-pixel Python loops.
+
+DEFAULT_PREPROCESS_CACHE = "/Users/Jon/Desktop/indiana communication /preprocess_cache"
+
+PREPROCESS_CONFIG = {
+    'source_dpi': None,    # None: trust the PNG's dpi tag - untagged pages keep their size
+    'target_dpi': 108,     # 3/4 of retina - text stays well above tesseract's comfort size
+    'window': 31,          # binarization neighbourhood in pixels (after scaling)
+    'k': 0.15,             # how far below the local mean a pixel must be to count as ink
+    'max_skew': 3.0,       # degrees either way
+    'skew_step': 0.25,
+}
+
+
+def config_hash(config=PREPROCESS_CONFIG):
+    """Short stable id for a preprocessing config - part of every cache key downstream"""
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+
+
+def source_dpi(img, config=PREPROCESS_CONFIG):
+    """The screenshot's resolution - its dpi tag, else config['source_dpi'], else None for unknown"""
+    dpi = img.info.get('dpi', (None,))[0]
+    return dpi or config['source_dpi']
+
+
+def normalize_dpi(img, config=PREPROCESS_CONFIG):
+    """(image, dpi) scaled down to target_dpi - never up, upscaling only costs OCR time
+
+    A page of unknown resolution is left alone and comes back with dpi None.
+    """
+    dpi = source_dpi(img, config)
+    if dpi is None or config['target_dpi'] is None or config['target_dpi'] >= dpi:
+        return img, dpi
+    scale = config['target_dpi'] / float(dpi)
+    size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+    return img.resize(size, Image.LANCZOS), config['target_dpi']
+
+
+def binarize(gray, window=31, k=0.15):
+    """Adaptive (Bradley) threshold: ink is anything k below its local mean
+
+    Local means come from an integral image, so it's a handful of array ops
+    regardless of window size. Returns a bool array, True = ink.
+    """
+    g = gray.astype(np.float64)
+    h, w = g.shape
+    half = window // 2
+    integral = np.zeros((h + 1, w + 1), dtype=np.float64)
+    integral[1:, 1:] = g.cumsum(axis=0).cumsum(axis=1)
+
+    y0 = np.clip(np.arange(h) - half, 0, h)
+    y1 = np.clip(np.arange(h) + half + 1, 0, h)
+    x0 = np.clip(np.arange(w) - half, 0, w)
+    x1 = np.clip(np.arange(w) + half + 1, 0, w)
+    band = integral[y1] - integral[y0]
+    sums = band[:, x1] - band[:, x0]
+    area = np.outer(y1 - y0, x1 - x0)
+    return g < (sums / area) * (1 - k)
+
+
+def estimate_skew(ink, max_angle=3.0, step=0.25):
+    """Skew angle in degrees from projection profiles
+
+    For each candidate angle the ink pixels are sheared onto rows with one
+    bincount; the angle with the sharpest row profile is the text baseline.
+    """
+    ys, xs = np.nonzero(ink)
+    if len(ys) < 100:
+        return 0.0
+    # A few hundred thousand pixels is plenty to find a baseline
+    if len(ys) > 200000:
+        pick = np.random.default_rng(0).choice(len(ys), 200000, replace=False)
+        ys, xs = ys[pick], xs[pick]
+
+    best_angle, best_score = 0.0, -1.0
+    for angle in np.arange(-max_angle, max_angle + step / 2, step):
+        rows = np.round(ys + xs * np.tan(np.radians(angle))).astype(np.int64)
+        rows -= rows.min()
+        profile = np.bincount(rows).astype(np.float64)
+        score = float(np.dot(profile, profile))
+        if score > best_score:
+            best_angle, best_score = float(angle), score
+    return best_angle
+
+
+def preprocess_image(img, config=PREPROCESS_CONFIG):
+    """Screenshot in, clean black-on-white 'L' image out, ready for tesseract
+
+    The output carries its dpi in .info when it is known, for tesseract_config().
+    """
+    img, dpi = normalize_dpi(img.convert('L'), config)
+    ink = binarize(np.asarray(img), config['window'], config['k'])
+    angle = estimate_skew(ink, config['max_skew'], config['skew_step'])
+    clean = Image.fromarray(np.where(ink, 0, 255).astype(np.uint8))
+    if angle:
+        # Text sits `angle` degrees off level, so rotate it back the other way
+        clean = clean.rotate(-angle, resample=Image.BILINEAR, expand=True, fillcolor=255)
+    if dpi:
+        clean.info['dpi'] = (dpi, dpi)
+    return clean
+
+
+def tesseract_config(img):
+    """Tell tesseract a preprocessed image's DPI - '' when it isn't known and tesseract has to guess"""
+    dpi = img.info.get('dpi')
+    return f"--dpi {round(dpi[0])}" if dpi else ''
+
+
+def preprocessed_png(data, img_hash, config=PREPROCESS_CONFIG, cache_dir=DEFAULT_PREPROCESS_CACHE, region=None):
+    """Preprocessed PNG bytes for a raw screenshot, cached by image hash + config + crop region"""
+    # Imported here - page_regions borrows binarize() from this module
+    from page_regions import crop_to_region, region_tag
+
+    path = None
+    if cache_dir:
+        name = f"{img_hash}_{config_hash(config)}_{region_tag(region)}.png"
+        path = os.path.join(cache_dir, img_hash[:2], name)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                return f.read()
+
+    img = crop_to_region(Image.open(io.BytesIO(data)), region)
+    out = io.BytesIO()
+    clean = preprocess_image(img, config)
+    # The dpi goes along in the PNG's pHYs chunk
+    clean.save(out, format='PNG', **({'dpi': clean.info['dpi']} if 'dpi' in clean.info else {}))
+    png = out.getvalue()
+
+    if path:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so a crashed run never leaves a half-written image behind
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(png)
+        os.replace(tmp, path)
+    return png
@@ -1,5 +1,7 @@
 import pandas as pd
-import re
+
+from junk_filter import JUNK_FILTERS
+from cleaning_engine import process_full_database_rows, finish, print_name_cache_stats
 
 # Load the FULL database, not just top 1000!
 df = pd.read_excel('/Users/Jon/Desktop/INDIGENOUS_BUSINESSES_FULL_DATABASE.xlsx', sheet_name='Full Database')
@@ -8,92 +10,14 @@ print("💪 PROCESSING FULL DATABASE WITH STRICT CLEANUP")
 print("=" * 60)
 print(f"Starting with: {len(df):,} total entries")
 
-clean_businesses = []
-
-for _, row in df.iterrows():
-    name = str(row.get('Business Name', '')).strip()
-    phone = str(row.get('Phone', '')).strip()
-    address = str(row.get('Address', '')).strip()
-    
-    # STRICT FILTERING - Skip if:
-    
-    # 1. No name or bad name
-    if not name or name == 'nan' or len(name) < 5:
-        continue
-    
-    # 2. Name starts with parenthesis (like your examples)
-    if name.startswith('('):
-        name = name.strip('()')
-        if len(name) < 5:
-            continue
-    
-    # 3. Name is just numbers/phone
-    if re.match(r'^[\d\s\-\(\)\.]+$', name):
-        continue
-    
-    # 4. Name is just a location
-    if name.lower() in ['québec', 'quebec', 'montréal', 'montreal', 'kahnawake']:
-        continue
-    
-    # 5. Name contains only generic words
-    generic_words = ['other', 'fax', 'tel', 'phone', 'street', 'road', 'avenue']
-    if any(name.lower() == word for word in generic_words):
-        continue
-    
-    # 6. Must have phone number
-    if not phone or phone == 'nan':
-        continue
-    
-    # Clean the business name
-    name = re.sub(r'^[^a-zA-Z0-9]+', '', name)  # Remove leading special chars
-    name = re.sub(r'[^a-zA-Z0-9\s\-\'\&\.]+', ' ', name)  # Clean special chars
-    name = ' '.join(name.split())  # Fix multiple spaces
-    
-    # Skip if still too short after cleaning
-    if len(name) < 5:
-        continue
-    
-    # Categorize
-    name_lower = name.lower()
-    
-    if any(word in name_lower for word in ['construction', 'builder', 'contractor', 'building']):
-        category = 'Construction'
-    elif any(word in name_lower for word in ['transport', 'trucking', 'freight', 'moving']):
-        category = 'Transportation'
-    elif any(word in name_lower for word in ['consulting', 'conseil', 'advisory', 'solutions']):
-        category = 'Consulting'
-    elif any(word in name_lower for word in ['development', 'développement', 'corporation']):
-        category = 'Business Development'
-    elif any(word in name_lower for word in ['hotel', 'motel', 'inn', 'lodge']):
-        category = 'Hospitality'
-    elif any(word in name_lower for word in ['store', 'mart', 'market', 'dépanneur']):
-        category = 'Retail'
-    elif any(word in name_lower for word in ['restaurant', 'café', 'food', 'pizza']):
-        category = 'Food Service'
-    elif any(word in name_lower for word in ['tech', 'software', 'computer', 'digital']):
-        category = 'Technology'
-    elif any(word in name_lower for word in ['fishing', 'fisheries', 'marine']):
-        category = 'Marine/Fishing'
-    elif any(word in name_lower for word in ['craft', 'artisan', 'art']):
-        category = 'Arts & Crafts'
-    else:
-        category = 'Other Business'
-    
-    clean_businesses.append({
-        'Business Name': name,
-        'Category': category,
-        'Phone': phone,
-        'Address': address if address != 'nan' else '',
-        'Has Address': 'Yes' if address != 'nan' and len(str(address)) > 10 else 'No'
-    })
-
-# Create final dataframe
-final_df = pd.DataFrame(clean_businesses)
+# STRICT FILTERING, name cleanup and categories (cleaning_engine.py)
+final_df = process_full_database_rows(df)
 
 # Remove duplicates
-final_df = final_df.drop_duplicates(subset=['Business Name', 'Phone'])
+final_df = finish('process_full_database_clean', final_df)
 
 print(f"\n✅ After strict cleanup: {len(final_df):,} VERIFIED businesses")
+print_name_cache_stats()
 
 # High-value categories
 high_value = final_df[final_df['Category'].isin([
@@ -101,6 +25,7 @@ high_value = final_df[final_df['Category'].isin([
     'Business Development', 'Technology'
 ])]
 
+JUNK_FILTERS['process_full_database_clean'].report("\n🗑️  Junk rejected by rule:")
 print(f"🎯 High-value businesses: {len(high_value):,}")
 
 # Save the REAL final version
@@ -1,41 +1,15 @@
 import pandas as pd
 
+from cleaning_engine import better_category_rows, finish
+
 # Load full database
 df = pd.read_excel('/Users/Jon/Desktop/INDIGENOUS_BUSINESSES_FULL_DATABASE.xlsx', sheet_name='Full Database')
 
 print("🔍 FINDING HIDDEN HIGH-VALUE BUSINESSES IN 'OTHER' CATEGORY")
 print("=" * 60)
 
-# Recategorize the "Other" businesses
-def better_categorize(name):
-    name_lower = name.lower()
-    
-    # More specific patterns
-    if any(word in name_lower for word in ['real estate', 'landholding', 'property']):
-        return 'Real Estate & Development'
-    elif any(word in name_lower for word in ['fisheries', 'fishing', 'seafood']):
-        return 'Fisheries & Marine'
-    elif any(word in name_lower for word in ['golf', 'resort', 'ecotourism']):
-        return 'Tourism'
-    elif any(word in name_lower for word in ['moving', 'freight', 'logistics']):
-        return 'Transportation'
-    elif any(word in name_lower for word in ['coffee', 'café', 'restaurant']):
-        return 'Food Services'
-    elif any(word in name_lower for word in ['eco', 'environmental']):
-        return 'Environmental Services'
-    elif any(word in name_lower for word in ['radio', 'church', 'police', 'school', 'arena']):
-        return 'Non-Commercial'  # Flag these
-    else:
-        return 'Other'
-
-# Update categories
-df['Better_Category'] = df.apply(
-    lambda row: better_categorize(row['Business Name']) if row['Category'] == 'Other' else row['Category'], 
-    axis=1
-)
-
-# Remove non-commercial
-commercial_df = df[df['Better_Category'] != 'Non-Commercial']
+# Recategorize the "Other" businesses and remove non-commercial
+commercial_df = better_category_rows(df)
 
 print(f"Found {len(df) - len(commercial_df)} non-commercial entities to remove")
 print(f"Final commercial businesses: {len(commercial_df):,}")
@@ -59,8 +33,7 @@ print(f"   (Perfect for procurement contracts!)")
 
 # Save improved version
 output = '/Users/Jon/Desktop/INDIGENOUS_BUSINESSES_FINAL_CATEGORIZED.xlsx'
-commercial_df.rename(columns={'Better_Category': 'Category'}, inplace=True)
-commercial_df.drop(columns=['Better_Category'], errors='ignore', inplace=True)
+commercial_df = commercial_df.rename(columns={'Better_Category': 'Category'})
 
 with pd.ExcelWriter(output, engine='openpyxl') as writer:
     summary = pd.DataFrame({
@@ -81,7 +54,7 @@ with pd.ExcelWriter(output, engine='openpyxl') as writer:
     })
     summary.to_excel(writer, sheet_name='Executive Summary', index=False)
     
-    commercial_df.head(1000).to_excel(writer, sheet_name='Top 1000 Businesses', index=False)
+    finish('recategorize_other', commercial_df).to_excel(writer, sheet_name='Top 1000 Businesses', index=False)
 
 print(f"\n💾 Saved to: {output}")
 print("\n🚀 NOW you have the PERFECT dataset for government!")
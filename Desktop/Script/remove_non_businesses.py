@@ -1,5 +1,6 @@
 import pandas as pd
-import re
+
+from cleaning_engine import FILTERS, remove_non_businesses_rows, finish
 
 # Load your file
 df = pd.read_excel('/Users/Jon/Desktop/INDIGENOUS_BUSINESSES_FINAL_GOVERNMENT.xlsx', sheet_name='Clean Data')
@@ -8,82 +9,12 @@ print("🧹 REMOVING NON-COMMERCIAL ENTITIES")
 print("=" * 60)
 print(f"Starting with {len(df)} entries")
 
-# Define patterns for NON-businesses to remove
-non_business_patterns = [
-    # Media (CBC is government, not Indigenous business)
-    r'CBC\s*/\s*Radio\s*Canada',
-    r'Radio-Canada',
-    r'Société Radio-Canada',
-    
-    # Government/Administrative
-    r'^Conseil de la (Nation|Première Nation|Communauté)',
-    r'^Conseil des Anicinapek',
-    r'^Conseil de bande',
-    r'Bureau administratif',
-    r'Cree Regional Authority',
-    
-    # Daycare/Schools (usually government funded)
-    r'Centre de la petite enfance',
-    r'École primaire',
-    r'École secondaire',
-    r'^Garderie',
-    
-    # Health centers (usually government)
-    r'Centre de santé',
-    r'Clinique médicale',
-    r'Health Centre$',
-    
-    # Churches
-    r'Church|Église',
-    r'Mission catholique',
-    
-    # Generic community services
-    r'^Centre communautaire',
-    r'Salle communautaire',
-    r'Community Hall',
-]
-
-# Mark non-businesses
-df['is_commercial'] = True
-for pattern in non_business_patterns:
-    mask = df['Business Name'].str.contains(pattern, case=False, na=False, regex=True)
-    df.loc[mask, 'is_commercial'] = False
-    if mask.sum() > 0:
-        print(f"Removing {mask.sum()} entries matching: {pattern[:30]}...")
-
-# Keep only commercial businesses
-commercial_df = df[df['is_commercial']].drop(columns=['is_commercial'])
-
-# Also remove duplicate radio stations and keep only unique businesses
-commercial_df = commercial_df.drop_duplicates(subset=['Business Name', 'Address'])
-
-# Refine categories for remaining businesses
-def refine_category(row):
-    name = row['Business Name'].lower()
-    
-    # Priority categorization
-    if any(word in name for word in ['construction', 'builder', 'contractor', 'excavation']):
-        return '🏗️ Construction'
-    elif any(word in name for word in ['transport', 'trucking', 'logistics', 'freight']):
-        return '🚛 Transportation'
-    elif any(word in name for word in ['hotel', 'motel', 'inn', 'lodge', 'tourism', 'resort']):
-        return '🏨 Tourism & Hospitality'
-    elif any(word in name for word in ['consulting', 'conseil', 'services professionnels']):
-        return '💼 Professional Services'
-    elif any(word in name for word in ['development', 'développement', 'corporation']):
-        return '📈 Economic Development'
-    elif any(word in name for word in ['store', 'mart', 'marché', 'dépanneur', 'boutique']):
-        return '🛒 Retail'
-    elif any(word in name for word in ['restaurant', 'café', 'cuisine', 'food']):
-        return '🍽️ Food Services'
-    elif any(word in name for word in ['technology', 'tech', 'software', 'computer']):
-        return '💻 Technology'
-    elif any(word in name for word in ['craft', 'artisan', 'art', 'culture']):
-        return '🎨 Arts & Crafts'
-    else:
-        return '📋 Other Services'
+# Keep only commercial businesses, unique by name and address, with refined
+# categories - sorted by category and name for the presentation
+commercial_df = finish('remove_non_businesses', remove_non_businesses_rows(df))
 
-commercial_df['Category'] = commercial_df.apply(refine_category, axis=1)
+# Show what the non-business rules caught
+FILTERS['remove_non_businesses'].report("🚫 Non-commercial entries removed by rule:")
 
 # Create final government presentation
 output = '/Users/Jon/Desktop/INDIGENOUS_COMMERCIAL_BUSINESSES_FINAL.xlsx'
@@ -122,7 +53,6 @@ with pd.ExcelWriter(output, engine='openpyxl') as writer:
     summary.to_excel(writer, sheet_name='Executive Summary', index=False)
     
     # All commercial businesses
-    commercial_df = commercial_df.sort_values(['Category', 'Business Name'])
     commercial_df.to_excel(writer, sheet_name='All Commercial Businesses', index=False)
     
     # High-value procurement targets
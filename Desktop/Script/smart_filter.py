@@ -1,5 +1,6 @@
 import pandas as pd
-import re
+
+from cleaning_engine import FILTERS, smart_filter_rows
 
 # Load your file
 df = pd.read_excel('/Users/Jon/Desktop/INDIGENOUS_BUSINESSES_FINAL_GOVERNMENT.xlsx', sheet_name='Clean Data')
@@ -8,68 +9,19 @@ print("🎯 SMART FILTERING - KEEPING REAL BUSINESSES")
 print("=" * 60)
 print(f"Starting with {len(df)} entries")
 
-# ONLY remove very specific non-businesses
-remove_exact = [
-    # CBC entries (clearly not Indigenous businesses)
-    'CBC / Radio Canada',
-    'Radio-Canada',
-    
-    # Duplicate school board entries
-    'Bureau administratif',
-    
-    # Government authorities
-    'Cree Regional Authority'
-]
-
-# Create a mask for exact matches
-remove_mask = df['Business Name'].isin(remove_exact)
-
-# Also remove entries that START with these (more precise)
-remove_patterns = [
-    r'^CBC\s*/\s*Radio Canada',  # CBC entries
-    r'^École primaire',  # Elementary schools only
-    r'^École secondaire',  # High schools only
-    r'^Bureau administratif',  # Admin offices
-]
-
-for pattern in remove_patterns:
-    pattern_mask = df['Business Name'].str.contains(pattern, na=False, regex=True)
-    remove_mask = remove_mask | pattern_mask
-
-# Keep everything else!
-clean_df = df[~remove_mask].copy()
+# ONLY remove very specific non-businesses - keep everything else!
+clean_df = smart_filter_rows(df)
 
 # Show what we're removing
-removed_df = df[remove_mask]
+removed_df = df.drop(clean_df.index)
 if len(removed_df) > 0:
     print("\n❌ REMOVING ONLY THESE:")
     for name in removed_df['Business Name'].unique():
         print(f"   - {name}")
+    FILTERS['smart_filter'].report("\n🚫 Removed by rule:")
 
 print(f"\n✅ KEEPING {len(clean_df)} businesses (removed only {len(removed_df)})")
 
-# Better categorization
-def smart_category(row):
-    name = row['Business Name'].lower()
-    
-    # High-value categories
-    if any(word in name for word in ['construction', 'builder', 'contractor']):
-        return 'Construction & Infrastructure'
-    elif any(word in name for word in ['transport', 'trucking', 'logistics']):
-        return 'Transportation & Logistics'
-    elif any(word in name for word in ['development', 'développement', 'corporation']):
-        return 'Economic Development'
-    elif any(word in name for word in ['consulting', 'professional', 'services']):
-        return 'Professional Services'
-    elif any(word in name for word in ['hotel', 'motel', 'lodge', 'tourism']):
-        return 'Tourism & Hospitality'
-    elif any(word in name for word in ['centre', 'center']) and 'health' not in name:
-        return 'Community Services'  # Keep community centers as they can get contracts
-    else:
-        return 'Other Business'
-
-clean_df['Category'] = clean_df.apply(smart_category, axis=1)
-
 # Save the carefully filtered list
 output = '/Users/Jon/Desktop/INDIGENOUS_BUSINESSES_SMART_FILTERED.xlsx'
 
@@ -0,0 +1,161 @@
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from cleaning_engine import CLEANERS, DEDUP_KEYS, FILTERS, SORT_KEYS, dedup_keys
+from junk_filter import JUNK_FILTERS
+
+# One cleaner over a dataset too big to load at once: batches stream from a
+# Parquet or CSV source through the cleaner's row-local part and are appended
+# to a Parquet or CSV sink. Only one batch is in memory at a time, plus a set
+# of hashes for the dedup step - that grows with the distinct businesses, not
+# the rows read. The hashes are 8 bytes, but as Python ints in a set they cost
+# about 70 bytes each (~70 MB per million distinct businesses).
+#
+# Parquet needs pyarrow. Without it the sink falls back to CSV.
+
+BATCH_SIZE = 50000
+
+# Cleaners whose whole-frame step is at most a dedup and a sort - the top-200
+# and top-1000 cuts need every row at once
+STREAMABLE = [name for name, (_, final) in CLEANERS.items() if final is None or name in DEDUP_KEYS]
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def read_batches(path, batch_size=BATCH_SIZE):
+    """DataFrames of up to batch_size rows from a Parquet file or a CSV"""
+    if path.lower().endswith('.parquet'):
+        pa = _pyarrow()
+        if pa is None:
+            raise ImportError("reading Parquet needs pyarrow - pip install pyarrow")
+        for batch in pa.parquet.ParquetFile(path).iter_batches(batch_size=batch_size):
+            yield batch.to_pandas()
+    else:
+        # Every cell as text, the way the scripts get them from read_excel()
+        yield from pd.read_csv(path, dtype=str, chunksize=batch_size)
+
+
+def _is_text(values):
+    return values.dtype == object or pd.api.types.is_string_dtype(values)
+
+
+class BatchSink:
+    """Appends batches to one Parquet file, or to a CSV"""
+
+    def __init__(self, path):
+        self.pa = _pyarrow() if path.lower().endswith('.parquet') else None
+        if path.lower().endswith('.parquet') and self.pa is None:
+            path = os.path.splitext(path)[0] + '.csv'
+            print(f"⚠️  pyarrow isn't installed - writing CSV to {path} instead")
+        self.path = path
+        self.writer = None
+        self.schema = None
+        self.started = False
+        self.rows = 0
+
+    def write(self, df):
+        if self.pa is None:
+            df.to_csv(self.path, mode='a' if self.started else 'w', header=not self.started, index=False)
+        else:
+            pa = self.pa
+            if self.schema is None:
+                # Text columns are fixed as strings up front - a batch where one is all empty
+                # would otherwise give it a null type the next batch can't append to
+                self.schema = pa.schema([
+                    pa.field(str(column), pa.string() if _is_text(df[column]) else pa.from_numpy_dtype(df[column].dtype))
+                    for column in df.columns
+                ])
+                self.writer = pa.parquet.ParquetWriter(self.path, self.schema)
+            text = {column: df[column].where(df[column].isna(), df[column].astype(str))
+                    for column in df.columns if _is_text(df[column])}
+            table = pa.Table.from_pandas(df.assign(**text), schema=self.schema, preserve_index=False)
+            self.writer.write_table(table)
+        self.started = True
+        self.rows += len(df)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+class StreamingDedup:
+    """A cleaner's dedup across batches - keeps the first row seen for each key"""
+
+    def __init__(self, name):
+        self.name = name
+        self.seen = set()
+
+    def __call__(self, df):
+        keys = pd.util.hash_pandas_object(dedup_keys(self.name, df), index=False).to_numpy()
+        first = ~pd.Series(keys).duplicated().to_numpy()
+        unseen = np.fromiter((key not in self.seen for key in keys.tolist()), dtype=bool, count=len(keys))
+        keep = first & unseen
+        self.seen.update(keys[keep].tolist())
+        return df[keep]
+
+
+def stream_clean(name, source, sink, batch_size=BATCH_SIZE):
+    """Run one cleaner over source a batch at a time, appending to sink
+
+    Same rows as clean() on the whole file, but in input order - cleaners that
+    also sort leave that to whoever loads the result.
+    Returns (rows read, rows written, batches, sink path).
+    """
+    if name not in STREAMABLE:
+        raise ValueError(f"{name} needs the whole frame at once and can't be streamed")
+    rows, _ = CLEANERS[name]
+    dedup = StreamingDedup(name) if name in DEDUP_KEYS else None
+    out = BatchSink(sink)
+    read = batches = 0
+    try:
+        for batch in read_batches(source, batch_size):
+            cleaned = rows(batch)
+            if dedup:
+                cleaned = dedup(cleaned)
+            out.write(cleaned)
+            read += len(batch)
+            batches += 1
+            print(f"   batch {batches:>4}: {read:>12,} rows read, {out.rows:>12,} kept", end='\r')
+    finally:
+        out.close()
+    print()
+    return read, out.rows, batches, out.path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Clean a large Parquet/CSV dump in fixed-size batches")
+    parser.add_argument('cleaner', choices=STREAMABLE)
+    parser.add_argument('source', help=".parquet or .csv to clean")
+    parser.add_argument('sink', help=".parquet or .csv to write")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    print(f"🌊 STREAMING {args.cleaner.upper()}")
+    print("=" * 60)
+    start = time.time()
+    read, written, batches, path = stream_clean(args.cleaner, args.source, args.sink, args.batch_size)
+
+    print(f"✅ {read:,} rows in {batches} batches of up to {args.batch_size:,} -> {written:,} rows "
+          f"({time.time() - start:.1f}s)")
+    if args.cleaner in JUNK_FILTERS:
+        JUNK_FILTERS[args.cleaner].report("\n🗑️  Junk rejected by rule:")
+    if args.cleaner in FILTERS:
+        FILTERS[args.cleaner].report("\n🚫 Non-businesses removed by rule:")
+    if args.cleaner in SORT_KEYS:
+        print(f"\nℹ️  Rows are in input order - sort by {SORT_KEYS[args.cleaner]} after loading if needed")
+    print(f"💾 Saved to: {path}")
+
+
+if __name__ == "__main__":
+    main()
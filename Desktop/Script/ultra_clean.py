@@ -1,5 +1,6 @@
 import pandas as pd
-import re
+
+from cleaning_engine import ultra_clean_rows
 
 # Load the government-ready file
 df = pd.read_excel('/Users/Jon/Desktop/INDIGENOUS_BUSINESSES_GOVERNMENT_READY.xlsx', sheet_name='All Businesses')
@@ -7,67 +8,8 @@ df = pd.read_excel('/Users/Jon/Desktop/INDIGENOUS_BUSINESSES_GOVERNMENT_READY.xl
 print("🔧 ULTRA CLEANING - FIXING POSTAL CODES")
 print("=" * 60)
 
-def extract_postal_code(address_text):
-    """Extract ANY postal code pattern from text"""
-    # Look for postal code at END of address
-    patterns = [
-        r'([A-Z]\d[A-Z]\s*\d[A-Z]\d)\s*$',  # At end
-        r'\)\s*([A-Z]\d[A-Z]\s*\d[A-Z]\d)',  # After province
-        r',\s*([A-Z]\d[A-Z]\s*\d[A-Z]\d)',   # After comma
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, str(address_text))
-        if match:
-            return match.group(1).replace(' ', '')  # Remove spaces in postal
-    return ''
-
-def clean_address(address, postal):
-    """Remove postal code from address"""
-    if not postal:
-        return address
-    
-    # Remove the postal code
-    clean = str(address).replace(postal, '')
-    # Remove with spaces
-    clean = clean.replace(postal[:3] + ' ' + postal[3:], '')
-    # Clean up trailing punctuation
-    clean = re.sub(r'[,\s\)]+$', '', clean)
-    # Fix double spaces
-    clean = re.sub(r'\s+', ' ', clean)
-    # Fix space before comma/parenthesis
-    clean = clean.replace(' ,', ',').replace(' )', ')')
-    
-    return clean.strip()
-
-# Process each row
-cleaned_data = []
-for _, row in df.iterrows():
-    address = str(row.get('Address', ''))
-    existing_postal = str(row.get('Postal Code', ''))
-    
-    # Try to extract postal from address
-    found_postal = extract_postal_code(address)
-    
-    # Use found postal if we don't have one, or if address contains one
-    if found_postal:
-        final_postal = found_postal
-        clean_addr = clean_address(address, found_postal)
-    else:
-        final_postal = existing_postal if existing_postal != 'nan' else ''
-        clean_addr = address
-    
-    cleaned_data.append({
-        'Business Name': row['Business Name'],
-        'Address': clean_addr,
-        'Postal Code': final_postal,
-        'Phone': row['Phone'],
-        'Province': row.get('Province', 'Unknown'),
-        'Category': row.get('Category', 'Other')
-    })
-
-# Create final dataframe
-final_df = pd.DataFrame(cleaned_data)
+# Move postal codes out of the address into their own column (cleaning_engine.py)
+final_df = ultra_clean_rows(df)
 
 # Create FINAL file
 output = '/Users/Jon/Desktop/INDIGENOUS_BUSINESSES_FINAL_GOVERNMENT.xlsx'
@@ -1,5 +1,6 @@
 import pandas as pd
-import re
+
+from cleaning_engine import FILTERS, use_full_database_rows
 
 # Load your FULL clean database!
 df = pd.read_excel('/Users/Jon/Desktop/Indigenous_Businesses_FINAL_CLEAN.xlsx')
@@ -8,69 +9,11 @@ print("💰 WORKING WITH YOUR FULL DATABASE!")
 print("=" * 60)
 print(f"Total businesses: {len(df):,}")
 
-# Clean up the data
-clean_data = []
-
-for _, row in df.iterrows():
-    name = str(row.get('business_name', '')).strip()
-    address = str(row.get('address', '')).strip()
-    phone = str(row.get('phone', '')).strip()
-    postal = str(row.get('postal_code', '')).strip()
-    
-    # Skip if name is too short or weird
-    if len(name) < 4 or name == 'nan':
-        continue
-        
-    # Extract postal from address if needed
-    if postal == 'nan' or not postal:
-        postal_match = re.search(r'([A-Z]\d[A-Z]\s*\d[A-Z]\d)', address)
-        if postal_match:
-            postal = postal_match.group(1)
-            address = address.replace(postal, '').strip()
-    
-    # Categorize businesses
-    name_lower = name.lower()
-    if any(word in name_lower for word in ['construction', 'builder', 'contractor']):
-        category = 'Construction'
-    elif any(word in name_lower for word in ['transport', 'trucking', 'freight']):
-        category = 'Transportation'
-    elif any(word in name_lower for word in ['conseil', 'council', 'development', 'corporation']):
-        category = 'Economic Development'
-    elif any(word in name_lower for word in ['service', 'consulting', 'professional']):
-        category = 'Professional Services'
-    elif any(word in name_lower for word in ['hotel', 'motel', 'inn', 'lodge']):
-        category = 'Tourism'
-    elif any(word in name_lower for word in ['store', 'mart', 'market', 'dépanneur']):
-        category = 'Retail'
-    elif 'centre' in name_lower or 'center' in name_lower:
-        category = 'Community Services'
-    else:
-        category = 'Other'
-    
-    clean_data.append({
-        'Business Name': name,
-        'Category': category,
-        'Address': address,
-        'Postal Code': postal if postal != 'nan' else '',
-        'Phone': phone if phone != 'nan' else ''
-    })
-
-# Create DataFrame
-final_df = pd.DataFrame(clean_data)
-
-# Remove obvious non-businesses
-non_business_patterns = [
-    r'^CBC\s*/\s*Radio',
-    r'^Radio-Canada',
-    r'^École primaire',
-    r'^École secondaire'
-]
-
-for pattern in non_business_patterns:
-    mask = ~final_df['Business Name'].str.contains(pattern, na=False, regex=True)
-    final_df = final_df[mask]
+# Clean up the data, categorize and remove obvious non-businesses (cleaning_engine.py)
+final_df = use_full_database_rows(df)
 
 print(f"\n✅ After cleaning: {len(final_df):,} businesses")
+FILTERS['use_full_database'].report("🚫 Non-businesses removed by rule:")
 
 # Save the FULL database
 output = '/Users/Jon/Desktop/INDIGENOUS_BUSINESSES_FULL_DATABASE.xlsx'
@@ -0,0 +1,224 @@
+import os
+import csv
+import time
+import argparse
+import threading
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+
+from extract_businesses import (FOLDERS, ENGINES, list_png_files, ocr_page, manifest_engine_label,
+                                _init_worker, _report_error)
+from extraction_manifest import ExtractionManifest, DEFAULT_MANIFEST_PATH
+from ocr_cache import DEFAULT_CACHE_PATH
+from ocr_backends import BACKENDS
+from preprocess import PREPROCESS_CONFIG
+
+# Long-running ingestion: watch the data folders, wait for new screenshots to
+# finish writing, OCR only those and append their businesses to the master CSV.
+# Uses watchdog (inotify on Linux, FSEvents on the Mac): pip install watchdog
+
+MASTER_CSV = "/Users/Jon/Desktop/Indigenous_Businesses_MASTER.csv"
+DEBOUNCE_SECONDS = 2.0
+
+
+class PendingFiles:
+    """PNGs we've heard about but not OCR'd yet - filled by the watcher thread"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.files = {}  # path -> (last event time, last seen size)
+
+    def touch(self, path):
+        if not path.lower().endswith('.png'):
+            return
+        with self.lock:
+            self.files[path] = (time.time(), None)
+
+    def ready(self, debounce, limit):
+        """Up to `limit` files that have been quiet for `debounce` seconds and stopped growing"""
+        now = time.time()
+        ready = []
+        with self.lock:
+            for path, (last_event, last_size) in list(self.files.items()):
+                if len(ready) >= limit:
+                    break
+                if now - last_event < debounce:
+                    continue
+                try:
+                    size = os.path.getsize(path)
+                except OSError:
+                    del self.files[path]  # deleted or renamed away before we got to it
+                    continue
+                if size != last_size:
+                    # Still being written (or first check) - look again next round
+                    self.files[path] = (now, size)
+                    continue
+                del self.files[path]
+                ready.append(path)
+        return ready
+
+    def __len__(self):
+        with self.lock:
+            return len(self.files)
+
+
+def _handler(pending):
+    from watchdog.events import FileSystemEventHandler
+
+    class PNGHandler(FileSystemEventHandler):
+        def on_created(self, event):
+            if not event.is_directory:
+                pending.touch(event.src_path)
+
+        def on_modified(self, event):
+            if not event.is_directory:
+                pending.touch(event.src_path)
+
+        def on_moved(self, event):
+            if not event.is_directory:
+                pending.touch(event.dest_path)
+
+    return PNGHandler()
+
+
+def append_to_master(rows, seen, master_csv=MASTER_CSV):
+    """Append rows we haven't seen before (by name + phone) to the master CSV"""
+    new_rows = []
+    for row in rows:
+        key = (row['name'], row['phone'])
+        if key not in seen:
+            seen.add(key)
+            new_rows.append(row)
+    if not new_rows:
+        return 0
+    fields = ['name', 'phone', 'folder', 'business_name', 'address', 'postal_code']
+    write_header = not os.path.exists(master_csv)
+    with open(master_csv, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+        if write_header:
+            writer.writeheader()
+        writer.writerows(new_rows)
+    return len(new_rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch the data folders and OCR new screenshots as they land")
+    parser.add_argument('--workers', type=int, default=0, help="OCR processes (0 = one per CPU core)")
+    parser.add_argument('--max-in-flight', type=int, default=0,
+                        help="most pages queued on the pool at once (default 2 per worker)")
+    parser.add_argument('--debounce', type=float, default=DEBOUNCE_SECONDS,
+                        help="seconds a file must be quiet before we OCR it")
+    parser.add_argument('--engine', choices=sorted(ENGINES), default='text')
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='subprocess')
+    parser.add_argument('--preprocess', action='store_true')
+    parser.add_argument('--crop', action='store_true')
+    parser.add_argument('--reocr-below', type=float, default=None, metavar='CONF')
+    parser.add_argument('--master', default=MASTER_CSV)
+    parser.add_argument('--manifest-path', default=DEFAULT_MANIFEST_PATH)
+    parser.add_argument('--cache-path', default=DEFAULT_CACHE_PATH)
+    parser.add_argument('--poll', action='store_true', help="poll the folders instead of using OS file events")
+    args = parser.parse_args()
+
+    try:
+        if args.poll:
+            from watchdog.observers.polling import PollingObserver as Observer
+        else:
+            from watchdog.observers import Observer
+    except ImportError:
+        print("❌ The watcher needs watchdog - pip install watchdog")
+        return
+
+    workers = args.workers or os.cpu_count()
+    max_in_flight = args.max_in_flight or workers * 2
+    preprocess = PREPROCESS_CONFIG if args.preprocess else None
+    folder_names = {os.path.normpath(path): name for path, name in FOLDERS}
+
+    # Same manifest labelling as extract_businesses.py --incremental, so the two share progress
+    engine_label = manifest_engine_label(args.engine, preprocess, args.crop, args.reocr_below)
+    manifest = ExtractionManifest(args.manifest_path, engine=engine_label)
+    seen = set()
+    if os.path.exists(args.master):
+        with open(args.master, newline='', encoding='utf-8') as f:
+            seen = {(row['name'], row['phone']) for row in csv.DictReader(f)}
+
+    pending = PendingFiles()
+    observer = Observer()
+    handler = _handler(pending)
+    for folder_path, _ in FOLDERS:
+        observer.schedule(handler, folder_path, recursive=False)
+    observer.start()
+
+    # Catch up on anything that landed while we weren't running
+    backlog = manifest.pending(list_png_files())
+    for png_path, _ in backlog:
+        pending.touch(png_path)
+
+    print("👀 WATCHING FOR NEW SCREENSHOTS")
+    print("=" * 60)
+    for folder_path, _ in FOLDERS:
+        print(f"📁 {folder_path}")
+    print(f"⚡ {workers} OCR workers, at most {max_in_flight} pages in flight, {args.debounce:.0f}s debounce")
+    print(f"📒 {len(backlog)} files waiting from before startup")
+    print(f"💾 Appending to: {args.master}")
+
+    work = partial(ocr_page, cache_path=args.cache_path, engine=args.engine, preprocess=preprocess,
+                   crop=args.crop, backend=args.backend, reocr_below=args.reocr_below)
+    in_flight = {}  # future -> png path
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    try:
+        while True:
+            # Backpressure: a bulk drop waits in `pending` instead of flooding the pool
+            room = max_in_flight - len(in_flight)
+            if room > 0:
+                for png_path in pending.ready(args.debounce, room):
+                    folder_name = folder_names.get(os.path.normpath(os.path.dirname(png_path)))
+                    if not folder_name:
+                        continue
+                    try:
+                        st = os.stat(png_path)
+                    except OSError:
+                        continue  # deleted or renamed away since it settled
+                    # A modify event that left size and mtime alone (a touch, a metadata change) needs no OCR
+                    if manifest.is_current(png_path, st.st_mtime, st.st_size):
+                        continue
+                    in_flight[pool.submit(work, (png_path, folder_name))] = png_path
+
+            if not in_flight:
+                time.sleep(0.5)
+                continue
+
+            done, _ = wait(in_flight, timeout=0.5, return_when=FIRST_COMPLETED)
+            for future in done:
+                png_path = in_flight.pop(future)
+                try:
+                    result = future.result()
+                    if result.error:
+                        _report_error(result)
+                    # Stats the file again - it may have been moved or deleted while it was OCR'd
+                    manifest.record(result.path, result.folder, result.rows, result.error)
+                except BrokenProcessPool:
+                    # A worker died and took the pool with it - nothing in flight will come back
+                    lost = [png_path] + list(in_flight.values())
+                    print(f"   ⚠️  OCR worker crashed, restarting the pool - {len(lost)} files left for the next start")
+                    in_flight.clear()
+                    pool.shutdown(wait=False)
+                    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+                    break
+                except Exception as e:
+                    print(f"   ⚠️  {os.path.basename(png_path)}: {type(e).__name__}: {e} - skipped")
+                    continue
+                added = append_to_master(result.rows, seen, args.master)
+                print(f"   ✅ {os.path.basename(result.path)}: {len(result.rows)} entries, {added} new "
+                      f"({len(in_flight)} in flight, {len(pending)} waiting)")
+    except KeyboardInterrupt:
+        print("\n👋 Stopping watcher - finished pages are saved, the rest get picked up next start")
+    finally:
+        pool.shutdown()
+        observer.stop()
+        observer.join()
+        manifest.close()
+
+
+if __name__ == "__main__":
+    main()